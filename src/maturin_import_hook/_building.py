@@ -11,6 +11,7 @@ import zipfile
 from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
@@ -199,6 +200,7 @@ def find_maturin(lower_version: tuple[int, int, int], upper_version: tuple[int,
         raise MaturinError(msg)
 
 
+@lru_cache
 def get_maturin_version(maturin_path: Path) -> tuple[int, int, int]:
     success, output = run_maturin(maturin_path, ["--version"])
     if not success:
@@ -281,9 +283,11 @@ def get_installation_freshness(
     """
     debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
+    # mtimes are compared as integer nanoseconds because the float st_mtime cannot represent
+    # current timestamps exactly, so distinct mtimes can incorrectly compare as equal
     try:
         oldest_installed_path, installation_mtime = min(
-            ((path, path.stat().st_mtime) for path in installed_paths), key=itemgetter(1)
+            ((path, os.stat(path).st_mtime_ns) for path in installed_paths), key=itemgetter(1)
         )
     except ValueError:
         return Freshness(False, "no installed files found", None, None)
@@ -294,14 +298,14 @@ def get_installation_freshness(
         return Freshness(False, "failed to read installed files", None, None)
 
     if debug_enabled:
-        logger.debug("oldest installed file: %s (at %f)", oldest_installed_path, installation_mtime)
+        logger.debug("oldest installed file: %s (at %f)", oldest_installed_path, installation_mtime * 1e-9)
 
-    if abs(build_status.build_mtime - installation_mtime) > 5e-3:
+    if abs(build_status.build_mtime - installation_mtime * 1e-9) > 5e-3:
         return Freshness(False, "installation mtime does not match build status mtime", oldest_installed_path, None)
 
     try:
         newest_source_path, source_mtime = max(
-            ((path, path.stat().st_mtime) for path in source_paths), key=itemgetter(1)
+            ((path, os.stat(path).st_mtime_ns) for path in source_paths), key=itemgetter(1)
         )
     except ValueError:
         msg = "no source files found"
@@ -313,7 +317,7 @@ def get_installation_freshness(
         raise ImportHookError(msg) from None
 
     if debug_enabled:
-        logger.debug("newest source file: %s (at %f)", newest_source_path, source_mtime)
+        logger.debug("newest source file: %s (at %f)", newest_source_path, source_mtime * 1e-9)
 
     if installation_mtime == source_mtime:
         # writes made in quick succession often result in exactly identical mtimes because the resolution of the mtime
@@ -328,7 +332,7 @@ def get_installation_freshness(
 
 def get_installation_mtime(installed_paths: Iterable[Path]) -> Optional[float]:
     try:
-        installation_mtime = min(path.stat().st_mtime for path in installed_paths)
+        installation_mtime = min(os.stat(path).st_mtime for path in installed_paths)
     except ValueError:
         logger.debug("no installed files found")
         return None
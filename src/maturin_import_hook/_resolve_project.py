@@ -1,4 +1,5 @@
 import itertools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, TypeVar
@@ -13,6 +14,11 @@ except ModuleNotFoundError:
 
 _T = TypeVar("_T")
 
+# parsed toml files keyed by path, size and mtime so that re-resolving a project
+# (eg after a rebuild clears the resolver cache) does not re-read and re-parse
+# manifests that have not changed. Modified files naturally miss the cache
+_toml_file_cache: dict[tuple[str, int, int], "_TomlFile"] = {}
+
 
 class _TomlFile:
     def __init__(self, path: Path, data: dict[Any, Any]) -> None:
@@ -21,9 +27,15 @@ class _TomlFile:
 
     @staticmethod
     def load(path: Path) -> "_TomlFile":
-        with path.open("rb") as f:
-            data = tomllib.load(f)
-        return _TomlFile(path, data)
+        stat = os.stat(path)
+        key = (os.fspath(path), stat.st_size, stat.st_mtime_ns)
+        toml_file = _toml_file_cache.get(key)
+        if toml_file is None:
+            with path.open("rb") as f:
+                data = tomllib.load(f)
+            toml_file = _TomlFile(path, data)
+            _toml_file_cache[key] = toml_file
+        return toml_file
 
     @staticmethod
     def from_string(path: Path, data_str: str) -> "_TomlFile":
@@ -599,9 +599,12 @@ class DefaultProjectFileSearcher(ProjectFileSearcher):
                 dirs[:] = sorted(dir_name for dir_name in dirs if dir_name not in excluded_dir_names)
                 files.sort()
                 for filename in files:
-                    file_path = dir_path / filename
-                    if file_path.suffix.lower() not in excluded_file_extensions:
-                        yield file_path
+                    # equivalent to `Path(filename).suffix` but avoids constructing
+                    # a Path for files that end up being excluded
+                    dot_index = filename.rfind(".")
+                    suffix = filename[dot_index:] if 0 < dot_index < len(filename) - 1 else ""
+                    if suffix.lower() not in excluded_file_extensions:
+                        yield dir_path / filename
             else:
                 dirs.clear()  # do not recurse further into this directory
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import os
 import platform
@@ -34,7 +35,9 @@ class TestOptions:
     test_suite_name: str
     timeout: int
     max_failures: int | None
+    jobs: int | None
     package_installer: PackageInstaller
+    reuse_venv: bool
     use_lld: bool
     profile: Path | None
     maturin_debug: bool
@@ -60,7 +63,7 @@ def _run_tests_serial(
     report_path = workspace / "report.html"
     report_path.unlink(missing_ok=True)
 
-    venv = _create_test_venv(python, workspace / "venv", options.package_installer)
+    venv = _create_test_venv(python, workspace / "venv", options.package_installer, reuse=options.reuse_venv)
     try:
         _run_test_in_environment(venv, workspace / "cache", reports_dir / "results.xml", options)
     finally:
@@ -108,6 +111,11 @@ def _run_test_in_environment(
         cmd += ["--junit-xml", str(report_output.resolve()), "-o", f"junit_suite_name={options.test_suite_name}"]
     if options.max_failures is not None:
         cmd += ["--maxfail", str(options.max_failures)]
+    if options.jobs is not None:
+        # distribute per-file rather than per-test because tests that install packages share
+        # the virtualenv, so tests using the same project names must not run concurrently
+        # (see the note in test_import_hook/conftest.py)
+        cmd += ["--numprocesses", str(options.jobs), "--dist", "loadfile"]
     cmd += [options.test_specification]
     log.info("running %s", subprocess.list2cmdline(cmd))
     proc = subprocess.run(cmd, env=env, check=False, timeout=options.timeout)
@@ -139,8 +147,22 @@ def _package_install_command(interpreter_path: Path, package_installer: PackageI
         raise ValueError(package_installer)
 
 
-def _create_test_venv(python: Path, venv_dir: Path, package_installer: PackageInstaller) -> VirtualEnv:
-    venv = VirtualEnv.create(venv_dir, python, package_installer)
+def _create_test_venv(
+    python: Path, venv_dir: Path, package_installer: PackageInstaller, *, reuse: bool = False
+) -> VirtualEnv:
+    fingerprint_path = venv_dir / ".venv_fingerprint.json"
+    fingerprint = json.dumps({
+        "interpreter": str(python),
+        "interpreter_mtime_ns": python.stat().st_mtime_ns,
+        "installer": package_installer.value,
+    })
+    if reuse and fingerprint_path.is_file() and fingerprint_path.read_text() == fingerprint:
+        log.info("reusing test virtualenv at '%s'", venv_dir)
+        venv = VirtualEnv(venv_dir, package_installer)
+    else:
+        venv = VirtualEnv.create(venv_dir, python, package_installer)
+    # installed even when reusing so that changes to the requirements are picked up
+    # (a no-op when everything is already satisfied)
     log.info("installing test requirements into virtualenv")
     proc = subprocess.run(
         [
@@ -158,6 +180,7 @@ def _create_test_venv(python: Path, venv_dir: Path, package_installer: PackageIn
         msg = "package installation failed"
         raise RuntimeError(msg)
     log.debug("%s", proc.stdout.decode())
+    fingerprint_path.write_text(fingerprint)
     log.info("test environment ready")
     return venv
 
@@ -233,9 +256,7 @@ class VirtualEnv:
 
     def activate(self, env: dict[str, str]) -> None:
         """set the environment as-if venv/bin/activate was run"""
-        path = env.get("PATH", "").split(os.pathsep)
-        path.insert(0, str(self.bin_dir))
-        env["PATH"] = os.pathsep.join(path)
+        env["PATH"] = f"{self.bin_dir}{os.pathsep}{env.get('PATH', '')}"
         env["VIRTUAL_ENV"] = str(self.root_dir)
 
 
@@ -306,6 +327,12 @@ def main() -> None:
         type=int,
         help="the maximum number of failures to allow before stopping testing",
     )
+    parser.add_argument(
+        "--jobs",
+        default=None,
+        type=int,
+        help="the number of pytest-xdist workers to run the test files on (defaults to running without workers)",
+    )
 
     parser.add_argument(
         "--html-report",
@@ -326,6 +353,14 @@ def main() -> None:
         default=PackageInstaller.UV,
         help="the package installer to use in the tests",
     )
+    parser.add_argument(
+        "--reuse-venv",
+        action="store_true",
+        help=(
+            "reuse the test virtualenv from a previous run if it was created from the same "
+            "interpreter and installer (faster, but less isolated)"
+        ),
+    )
     parser.add_argument(
         "--lld",
         action="store_true",
@@ -356,7 +391,9 @@ def main() -> None:
         test_suite_name=args.name,
         timeout=args.timeout,
         max_failures=args.max_failures,
+        jobs=args.jobs,
         package_installer=args.installer,
+        reuse_venv=args.reuse_venv,
         use_lld=args.lld,
         profile=args.profile,
         maturin_debug=args.maturin_debug,
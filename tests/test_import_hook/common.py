@@ -10,12 +10,13 @@ import subprocess
 import sys
 import tempfile
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Optional, TypeVar, Union
 
 script_dir = Path(__file__).resolve().parent
 log = logging.getLogger(__name__)
@@ -86,8 +87,8 @@ def resolved_packages() -> dict[str, Optional[ResolvedPackage]]:
         commit_hash = data["commit"]
         git_path = shutil.which("git")
         assert git_path is not None
-        cmd = [git_path, "rev-parse", "HEAD"]
-        current_commit_hash = subprocess.check_output(cmd, cwd=MATURIN_DIR).decode().strip()
+        cmd = [git_path, "-C", str(MATURIN_DIR), "rev-parse", "HEAD"]
+        current_commit_hash = subprocess.check_output(cmd).decode().strip()
         assert current_commit_hash == commit_hash, (
             "the maturin submodule is not in sync with resolved.json. See package_resolver/README.md for details"
         )
@@ -107,6 +108,7 @@ def map_optional(value: Optional[T], f: Callable[[T], U]) -> Optional[U]:
     return None if value is None else f(value)
 
 
+@lru_cache
 def with_underscores(project_name: str) -> str:
     return project_name.replace("-", "_")
 
@@ -147,6 +149,12 @@ def run_python(
     if profile is not None:
         cmd += ["-m", "cProfile", "-o", str(profile.resolve())]
     cmd.extend(args)
+    # the tests only depend on the virtualenv, so the subprocess can skip scanning the
+    # user site-packages during startup (this also stops user-installed packages from
+    # interfering with the tests)
+    if env is None:
+        env = os.environ.copy()
+    env.setdefault("PYTHONNOUSERSITE", "1")
     log.info("running python ('%s')", interpreter_path)
     try:
         proc = subprocess.run(
@@ -157,9 +165,9 @@ def run_python(
             cwd=cwd,
             env=env,
         )
-        output = proc.stdout.decode()
+        output = proc.stdout.decode("utf-8", errors="replace")
     except subprocess.CalledProcessError as e:
-        output = e.stdout.decode()
+        output = e.stdout.decode("utf-8", errors="replace")
         if not expect_error:
             message = "\n".join([
                 "-" * 40,
@@ -217,31 +225,79 @@ def run_python_code(
         )
 
 
+_ANSII_ESCAPE_REGEX = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
 def remove_ansii_escape_characters(text: str) -> str:
     """Remove escape characters (eg used to color terminal output) from the given string.
 
     based on: https://stackoverflow.com/a/14693789
     """
-    return re.sub(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])", "", text)
+    return _ANSII_ESCAPE_REGEX.sub("", text)
 
 
-def check_match(text: str, pattern: str, *, flags: int = 0) -> None:
-    matches = re.fullmatch(pattern, text, flags=flags) is not None
+def check_match(text: str, pattern: "Union[str, re.Pattern[str]]", *, flags: int = 0) -> None:
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, flags)
+    matches = pattern.fullmatch(text) is not None
     if not matches:
         log.error("text = %s", repr(text))
-    assert matches, f'text does not match pattern:\npattern: "{pattern}"\ntext:\n{text}'
+    assert matches, f'text does not match pattern:\npattern: "{pattern.pattern}"\ntext:\n{text}'
+
+
+def check_match_fast(text: str, parts: Sequence[tuple[str, str]]) -> None:
+    """check that the given parts occur in `text` in order (with anything in between).
+
+    equivalent to `check_match` with the parts escaped and joined with ".*" (and
+    `re.DOTALL`), but literal parts are located with `str.find` instead of making the
+    regex engine walk the whole buffer through one large concatenated pattern.
+
+    each part is a `(kind, value)` pair where kind is "lit" (value is a literal substring)
+    or "re" (value is a regex searched for with `re.search`)
+    """
+    cursor = 0
+    for kind, value in parts:
+        if kind == "lit":
+            index = text.find(value, cursor)
+            next_cursor = index + len(value)
+        elif kind == "re":
+            match = re.compile(value, re.DOTALL).search(text, cursor)
+            index = -1 if match is None else match.start()
+            next_cursor = 0 if match is None else match.end()
+        else:
+            raise ValueError(kind)
+        if index == -1:
+            log.error("text = %s", repr(text))
+        assert index != -1, f'text does not contain expected part ({kind}):\npart: "{value}"\ntext:\n{text}'
+        cursor = next_cursor
+
+
+_INFO_LINE_REGEX = re.compile(r"^.*\[INFO\].*$", re.MULTILINE)
+
+
+def get_info_lines(text: str) -> str:
+    """the lines of `text` that contain '[INFO]'.
+
+    equivalent to filtering `text.splitlines()` but scans the buffer in one pass without
+    allocating a list of every line (the outputs being filtered can be large, eg when
+    they include compiler output)
+    """
+    return "\n".join(_INFO_LINE_REGEX.findall(text))
 
 
 def get_string_between(text: str, start: str, end: str) -> Optional[str]:
-    start_index = text.find(start)
-    if start_index == -1:
+    # find/slice instead of partition to avoid copying the unused parts of the text
+    i = text.find(start)
+    if i == -1:
         return None
-    end_index = text.find(end)
-    if end_index == -1:
+    i += len(start)
+    j = text.find(end, i)
+    if j == -1:
         return None
-    return text[start_index + len(start) : end_index]
+    return text[i:j]
 
 
+@lru_cache
 def missing_entrypoint_error_message_pattern(name: str) -> str:
     if platform.python_implementation() == "CPython":
         return f"dynamic module does not define module export function \\(PyInit_{name}\\)"
@@ -285,25 +341,31 @@ def run_concurrent_python(
     return outputs
 
 
-def get_file_times(path: Path) -> tuple[float, float]:
+def get_file_times(path: Path) -> tuple[int, int]:
+    """the access and modification times of the given file as nanosecond integers
+
+    using integer nanoseconds instead of float seconds means the times can be copied onto
+    another file exactly, so files given identical times do not need to be re-written to
+    account for the float round-trip losing precision
+    """
     s = path.stat()
-    times = (s.st_atime, s.st_mtime)
+    times = (s.st_atime_ns, s.st_mtime_ns)
     if platform.system() == "Windows" and platform.python_implementation() == "PyPy":
         # workaround for https://github.com/pypy/pypy/issues/4916
         for _ in range(10):
             set_file_times(path, times)
-            if path.stat().st_mtime == times[1]:
+            if path.stat().st_mtime_ns == times[1]:
                 break
     return times
 
 
-def set_file_times_recursive(path: Path, times: tuple[float, float]) -> None:
+def set_file_times_recursive(path: Path, times: tuple[int, int]) -> None:
     for p in path.rglob("*"):
-        os.utime(p, times)
+        os.utime(p, ns=times)
 
 
-def set_file_times(path: Path, times: tuple[float, float]) -> None:
-    os.utime(path, times)
+def set_file_times(path: Path, times: tuple[int, int]) -> None:
+    os.utime(path, ns=times)
 
 
 @contextmanager
@@ -320,8 +382,13 @@ def capture_logs(log: Optional[logging.Logger] = None, level: int = logging.INFO
         log.removeHandler(handler)
 
 
+@lru_cache
 def remove_executable_from_path(path: str, executable_name: str) -> str:
-    """filter out the elements of the PATH environment variable that contain an executable with the given name"""
+    """filter out the elements of the PATH environment variable that contain an executable with the given name
+
+    cached since searching every PATH entry is slow and the filtered result for a given
+    PATH value does not change while the tests run
+    """
     log.info("removing %s from PATH = '%s'", executable_name, path)
     executable_path = shutil.which(executable_name, path=path)
     while executable_path is not None:
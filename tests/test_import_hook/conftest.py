@@ -1,15 +1,41 @@
 import logging
+import os
+import platform
 import shutil
 import sys
+import tempfile
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from maturin_import_hook import reset_logger
-from maturin_import_hook._building import get_default_build_dir
+# when running with pytest-xdist, give each worker a separate build cache so that the
+# _clean_build_cache fixture of one worker does not interfere with the builds of another.
+# note that tests that install packages still share the virtualenv so tests using the same
+# project names must not be scheduled concurrently (eg use `--dist loadfile`)
+_worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+if _worker_id is not None and "MATURIN_BUILD_DIR" not in os.environ:
+    os.environ["MATURIN_BUILD_DIR"] = str(Path(sys.exec_prefix) / f"maturin_build_cache_{_worker_id}")
 
-from .common import CLEAR_WORKSPACE
+# on linux, putting the per-test workspaces on the RAM-backed /dev/shm avoids disk I/O for
+# the many small files the tests write. The heavyweight compiled artifacts live under
+# CARGO_TARGET_DIR and the build cache so this does not use a significant amount of memory
+if platform.system() == "Linux" and "TMPDIR" not in os.environ:
+    _shm = Path("/dev/shm")
+    if _shm.is_dir() and os.access(_shm, os.W_OK):
+        os.environ["TMPDIR"] = str(_shm)
+        tempfile.tempdir = None  # discard any cached location
+
+# sharing a cargo target directory across the maturin builds triggered by the tests turns
+# most repeat builds into incremental rebuilds. runner.py configures a persistent location,
+# this is a fallback for when the tests are run directly
+if "CARGO_TARGET_DIR" not in os.environ:
+    os.environ["CARGO_TARGET_DIR"] = str(Path(sys.exec_prefix) / "maturin_import_hook_test_target")
+
+from maturin_import_hook import reset_logger  # noqa: E402
+from maturin_import_hook._building import get_default_build_dir  # noqa: E402
+
+from .common import CLEAR_WORKSPACE  # noqa: E402
 
 reset_logger()  # so that logs can be captured for testing
 logging.basicConfig(format="[%(name)s] [%(levelname)s] %(message)s", level=logging.DEBUG)
@@ -511,21 +511,27 @@ def _test_submodule() -> None:
     log.info("SUCCESS")
 
 
-if action == "_test_basic_reload":
-    _test_basic_reload()
-elif action == "_test_globals":
-    _test_globals()
-elif action == "_test_other_module":
-    _test_other_module()
-elif action == "_test_reload_without_import_hook":
-    _test_reload_without_import_hook()
-elif action == "_test_install_after_import":
-    _test_install_after_import()
-elif action == "_test_compilation_error":
-    _test_compilation_error()
-elif action == "_test_pickling":
-    _test_pickling()
-elif action == "_test_submodule":
-    _test_submodule()
-else:
-    raise ValueError(action)
+_TEST_FUNCTIONS = {
+    "_test_basic_reload": _test_basic_reload,
+    "_test_globals": _test_globals,
+    "_test_other_module": _test_other_module,
+    "_test_reload_without_import_hook": _test_reload_without_import_hook,
+    "_test_install_after_import": _test_install_after_import,
+    "_test_compilation_error": _test_compilation_error,
+    "_test_pickling": _test_pickling,
+    "_test_submodule": _test_submodule,
+}
+
+# a comma-separated list of test names may be given to chain scenarios in a single
+# interpreter (saves an interpreter and import hook startup per scenario when debugging
+# locally). The automated tests run each scenario individually since the scenarios
+# assume a freshly started interpreter
+test_names = action.split(",")
+for name in test_names:
+    if name not in _TEST_FUNCTIONS:
+        raise ValueError(name)
+    if len(test_names) > 1:
+        log.info("=== begin %s ===", name)
+    _TEST_FUNCTIONS[name]()
+    if len(test_names) > 1:
+        log.info("=== end %s ===", name)
@@ -1,4 +1,4 @@
-import json
+import importlib
 import logging
 import os
 import platform
@@ -7,11 +7,12 @@ import shutil
 import site
 import subprocess
 import sys
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
-from typing import Any
+from typing import Any, Optional
 
 import pytest
 
@@ -23,11 +24,12 @@ from .common import (
     TEST_CRATES_DIR,
     all_usable_test_crate_names,
     check_match,
+    check_match_fast,
     create_echo_script,
     get_file_times,
+    get_info_lines,
     get_string_between,
     missing_entrypoint_error_message_pattern,
-    mixed_test_crate_names,
     remove_ansii_escape_characters,
     remove_executable_from_path,
     run_concurrent_python,
@@ -49,27 +51,35 @@ script_dir = Path(__file__).parent.resolve()
 helpers_dir = script_dir / "project_importer_helpers"
 log = logging.getLogger(__name__)
 
+# path dependencies tested separately. computed once since several tests parametrize over these names
+_EMPTY_SEARCHER = DefaultProjectFileSearcher(
+    source_excluded_dir_names=set(),
+    source_excluded_dir_markers=set(),
+    source_excluded_file_extensions=set(),
+)
+"""a stateless searcher with no exclusions, shared by the tests that need one"""
+
+_CRATES_WITHOUT_PATH_DEP = tuple(n for n in all_usable_test_crate_names() if n != "pyo3-mixed-with-path-dep")
+_MIXED_CRATES_WITHOUT_PATH_DEP = tuple(n for n in _CRATES_WITHOUT_PATH_DEP if "mixed" in n)
+
 
 @pytest.fixture(autouse=True)
 def _reset_virtualenv() -> Iterator[None]:
     """uninstall packages installed during each test. Technically not necessary since additional packages should
     not interfere with the tests but should result in clearer logs"""
-    packages_before = _get_installed_package_names()
+    packages_before = _get_installed_package_names_in_process()
     try:
         yield
     finally:
-        packages_after = _get_installed_package_names()
+        importlib.invalidate_caches()
+        packages_after = _get_installed_package_names_in_process()
         packages_to_uninstall = sorted(packages_after - packages_before)
         if packages_to_uninstall:
             log.info("uninstalling packages installed during this test: %s", packages_to_uninstall)
             _uninstall(*packages_to_uninstall)
 
 
-@pytest.mark.parametrize(
-    "project_name",
-    # path dependencies tested separately
-    sorted(set(all_usable_test_crate_names()) - {"pyo3-mixed-with-path-dep"}),
-)
+@pytest.mark.parametrize("project_name", _CRATES_WITHOUT_PATH_DEP)
 def test_install_from_script_inside(workspace: Path, project_name: str) -> None:
     """This test ensures that when a script is run from within a maturin project, the
     import hook can identify and install the containing project even if it is not
@@ -212,11 +222,7 @@ def test_do_not_rebuild_if_installed_non_editable(workspace: Path, project_name:
 
 
 @pytest.mark.parametrize("initially_mixed", [False, True])
-@pytest.mark.parametrize(
-    "project_name",
-    # path dependencies tested separately
-    sorted(set(all_usable_test_crate_names()) - {"pyo3-mixed-with-path-dep"}),
-)
+@pytest.mark.parametrize("project_name", _CRATES_WITHOUT_PATH_DEP)
 def test_import_editable_installed_rebuild(workspace: Path, project_name: str, initially_mixed: bool) -> None:
     """This test ensures that an editable installed project is rebuilt when necessary if the import
     hook is active. This applies to mixed projects (which are installed as .pth files into
@@ -264,11 +270,7 @@ def test_import_editable_installed_rebuild(workspace: Path, project_name: str, i
     assert _is_editable_installed_correctly(project_name, project_dir, "mixed" in project_name)
 
 
-@pytest.mark.parametrize(
-    "project_name",
-    # path dependencies tested separately
-    sorted(set(mixed_test_crate_names()) - {"pyo3-mixed-with-path-dep"}),
-)
+@pytest.mark.parametrize("project_name", _MIXED_CRATES_WITHOUT_PATH_DEP)
 def test_import_editable_installed_mixed_missing(workspace: Path, project_name: str) -> None:
     """This test ensures that editable installed mixed projects are rebuilt if they are imported
     and their artifacts are missing.
@@ -399,18 +401,27 @@ def test_import_multiple_projects(workspace: Path) -> None:
     _uninstall("pyo3-mixed")
     _uninstall("pyo3-pure")
 
+    from concurrent.futures import ThreadPoolExecutor
+
     mixed_dir = _create_project_from_blank_template("pyo3-mixed", workspace / "pyo3-mixed", mixed=True)
     pure_dir = _create_project_from_blank_template("pyo3-pure", workspace / "pyo3-pure", mixed=False)
 
-    _install_editable(mixed_dir)
+    # the installations are subprocess-bound and have no data dependency so can run concurrently
+    with ThreadPoolExecutor(2) as executor:
+        list(executor.map(_install_editable, [mixed_dir, pure_dir]))
     assert _is_editable_installed_correctly("pyo3-mixed", mixed_dir, True)
-    _install_editable(pure_dir)
     assert _is_editable_installed_correctly("pyo3-pure", pure_dir, False)
 
     shutil.rmtree(mixed_dir)
     shutil.rmtree(pure_dir)
-    _get_project_copy(TEST_CRATES_DIR / "pyo3-mixed", mixed_dir)
-    _get_project_copy(TEST_CRATES_DIR / "pyo3-pure", pure_dir)
+    with ThreadPoolExecutor(2) as executor:
+        list(
+            executor.map(
+                _get_project_copy,
+                [TEST_CRATES_DIR / "pyo3-mixed", TEST_CRATES_DIR / "pyo3-pure"],
+                [mixed_dir, pure_dir],
+            )
+        )
 
     check_installed = "{}\n\n{}\n\n{}".format(
         IMPORT_HOOK_HEADER,
@@ -445,9 +456,11 @@ def test_rebuild_on_change_to_path_dependency(workspace: Path) -> None:
     project_name = "pyo3-mixed-with-path-dep"
     _uninstall(project_name)
 
-    project_dir = _get_project_copy(TEST_CRATES_DIR / project_name, workspace / project_name)
-    _get_project_copy(TEST_CRATES_DIR / "some_path_dep", workspace / "some_path_dep")
-    transitive_dep_dir = _get_project_copy(TEST_CRATES_DIR / "transitive_path_dep", workspace / "transitive_path_dep")
+    project_dir, _, transitive_dep_dir = _create_project_copies(
+        (TEST_CRATES_DIR / project_name, workspace / project_name),
+        (TEST_CRATES_DIR / "some_path_dep", workspace / "some_path_dep"),
+        (TEST_CRATES_DIR / "transitive_path_dep", workspace / "transitive_path_dep"),
+    )
 
     _install_editable(project_dir)
     assert _is_editable_installed_correctly(project_name, project_dir, True)
@@ -487,8 +500,7 @@ def test_rebuild_on_settings_change(workspace: Path, is_mixed: bool) -> None:
 
     project_dir = _create_project_from_blank_template("my-project", workspace / "my-project", mixed=is_mixed)
     shutil.copy(helpers_dir / "my_project.rs", project_dir / "src/lib.rs")
-    manifest_path = project_dir / "Cargo.toml"
-    manifest_path.write_text(f"{manifest_path.read_text()}\n[features]\nlarge_number = []\n")
+    _append_text(project_dir / "Cargo.toml", "\n[features]\nlarge_number = []\n")
 
     _install_editable(project_dir)
     assert _is_editable_installed_correctly("my-project", project_dir, is_mixed)
@@ -576,7 +588,7 @@ def test_low_resolution_mtime(workspace: Path) -> None:
     extension_stat = extension_path.stat()
     source_code_stat = lib_path.stat()
     # extension mtime should be strictly greater to remove the ambiguity about which is newer
-    assert source_code_stat.st_mtime < extension_stat.st_mtime
+    assert source_code_stat.st_mtime_ns < extension_stat.st_mtime_ns
 
     output4, _ = run_python([str(helper_path)], cwd=workspace)
     assert 'building "my_project"' not in output4
@@ -596,6 +608,12 @@ class TestReload:
 
     @staticmethod
     def _create_reload_project(output_dir: Path, mixed: bool) -> tuple[Path, Path]:
+        """create and install a fresh my-project for a single test.
+
+        the project cannot be shared between tests (eg via a module-scoped fixture keyed
+        on `mixed`) because every reload scenario modifies the project sources in place
+        and depends on starting from the template state
+        """
         project_dir = _create_project_from_blank_template("my-project", output_dir / "my-project", mixed=mixed)
         if mixed:
             init = dedent("""\
@@ -667,47 +685,13 @@ class TestReload:
         output, _ = run_python(
             [str(helpers_dir / "reload_helper.py"), str(lib_path), "_test_basic_reload"], cwd=workspace
         )
-        info = "\n".join(line for line in output.splitlines() if "[INFO]" in line)
+        info = get_info_lines(output)
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
         # This checks that the INFO level logs are exactly these messages (with nothing in between).
         # This verifies that rebuilds and module initialisation are behaving as expected
-        expected_info_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [INFO] building "my_project"'),  # because: no build status
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] initial import finish"),
-            e("root [INFO] comparing Integer instances a and b"),
-            e("root [INFO] comparing Integer instances a and c"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload 1 start"),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload 1 finish"),
-            e("root [INFO] comparing Integer instances d and e"),
-            e("reload_helper [INFO] reload 2 start"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload 3 start"),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload 3 finish"),
-            e("reload_helper [INFO] reload 4 start"),
-            e("reload_helper [INFO] reload 4 finish"),
-            e("reload_helper [INFO] SUCCESS"),
-        ]
-        expected_info_pattern = "\n".join(line for line in expected_info_parts if line)
-        check_match(info, expected_info_pattern, flags=re.MULTILINE)
+        check_match(info, _basic_reload_expected_info_pattern(is_mixed=is_mixed))
 
         # these checks ensure that the internals of the import hook are performing the expected actions
         initial_import = get_string_between(output, "initial import start", "initial import finish")
@@ -772,43 +756,11 @@ class TestReload:
         _project_dir, lib_path = self._create_reload_project(workspace, mixed=True)
 
         output, _ = run_python([str(helpers_dir / "reload_helper.py"), str(lib_path), "_test_globals"], cwd=workspace)
-        info = "\n".join(line for line in output.splitlines() if "[INFO]" in line)
+        info = get_info_lines(output)
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_info_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised"),
-            e("root [INFO] my_project other_module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] checking extension module"),
-            e("reload_helper [INFO] checking root module"),
-            e("reload_helper [INFO] checking other_module"),
-            e("reload_helper [INFO] reload 1 start"),
-            e("root [INFO] my_project __init__ initialised"),
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] checking extension module"),
-            e("reload_helper [INFO] checking root module"),
-            e("reload_helper [INFO] checking other_module"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload 2 start"),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised"),
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] checking extension module"),
-            e("reload_helper [INFO] checking root module"),
-            e("reload_helper [INFO] checking other_module"),
-            e("reload_helper [INFO] SUCCESS"),
-        ]
-        expected_info_pattern = "\n".join(line for line in expected_info_parts if line)
-        check_match(info, expected_info_pattern, flags=re.MULTILINE)
+        check_match(info, _globals_expected_info_pattern())
 
     def test_other_module(self, workspace: Path) -> None:
         """test the behaviour of reloading a mixed python/rust package with python modules
@@ -820,37 +772,11 @@ class TestReload:
         output, _ = run_python(
             [str(helpers_dir / "reload_helper.py"), str(lib_path), "_test_other_module"], cwd=workspace
         )
-        info = "\n".join(line for line in output.splitlines() if "[INFO]" in line)
+        info = get_info_lines(output)
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_info_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [INFO] building "my_project"'),  # because: no build status
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised"),
-            e("root [INFO] my_project other_module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload other_module start"),
-            e("root [INFO] my_project other_module initialised"),
-            e("reload_helper [INFO] reload other_module finish"),
-            e("reload_helper [INFO] reload package start"),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised"),
-            e("reload_helper [INFO] reload package finish"),
-            e("reload_helper [INFO] reload other_module start"),
-            e("root [INFO] my_project other_module initialised"),
-            e("reload_helper [INFO] reload other_module finish"),
-            e("reload_helper [INFO] SUCCESS"),
-        ]
-        expected_info_pattern = "\n".join(line for line in expected_info_parts if line)
-        check_match(info, expected_info_pattern, flags=re.MULTILINE)
+        check_match(info, _other_module_expected_info_pattern())
 
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_reload_without_import_hook(self, workspace: Path, is_mixed: bool) -> None:
@@ -863,32 +789,7 @@ class TestReload:
         )
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] reload package start"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload package finish"),
-            e("reload_helper [INFO] installing import hook"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload package start"),
-            e('maturin_import_hook [DEBUG] package "my_project" is already loaded and enable_reloading=False'),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload package finish"),
-            e("reload_helper [INFO] reload extension module start"),
-            e("reload_helper [INFO] reload extension module finish"),
-            e("reload_helper [INFO] uninstalling import hook"),
-            e("reload_helper [INFO] reload package start"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload package finish"),
-            e("reload_helper [INFO] SUCCESS\n"),
-        ]
-        expected_pattern = "\n".join(line for line in expected_parts if line)
-        check_match(output, expected_pattern, flags=re.MULTILINE)
+        check_match(output, _reload_without_import_hook_expected_pattern(is_mixed=is_mixed))
 
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_install_after_import(self, workspace: Path, is_mixed: bool) -> None:
@@ -901,29 +802,11 @@ class TestReload:
         output, _ = run_python(
             [str(helpers_dir / "reload_helper.py"), str(lib_path), "_test_install_after_import"], cwd=workspace
         )
-        info = "\n".join(line for line in output.splitlines() if "[INFO]" in line)
+        info = get_info_lines(output)
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] installing import hook"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-        ]
-        expected_pattern = "\n".join(line for line in expected_parts if line)
-        check_match(info, expected_pattern, flags=re.MULTILINE)
+        check_match(info, _install_after_import_expected_info_pattern(is_mixed=is_mixed))
 
     def test_compilation_error(self, workspace: Path) -> None:
         _uninstall("my-project")
@@ -934,35 +817,7 @@ class TestReload:
         )
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project"'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            e("expected expression, found `;`"),
-            e("maturin failed"),
-            e("reload_helper [INFO] reload failed"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(line for line in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _compilation_error_expected_parts())
 
     def test_pickling(self, workspace: Path) -> None:
         """test the classes that can be pickled behave as expected when the module is reloaded"""
@@ -972,27 +827,7 @@ class TestReload:
         output, _ = run_python([str(helpers_dir / "reload_helper.py"), str(lib_path), "_test_pickling"], cwd=workspace)
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project"'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(line for line in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _pickling_expected_parts())
 
     def test_submodule(self, workspace: Path) -> None:
         _uninstall("my-project")
@@ -1001,54 +836,40 @@ class TestReload:
         output, _ = run_python([str(helpers_dir / "reload_helper.py"), str(lib_path), "_test_submodule"], cwd=workspace)
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project"'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying project"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
-            e('maturin_import_hook [INFO] building "my_project"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s',
-            e("root [INFO] my_project extension module initialised"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] reload start"),
-            e("reload_helper [INFO] reload failed"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(line for line in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _submodule_expected_parts())
 
 
 class TestLogging:
     """These tests ensure that the desired messages are visible to the user in the default logging configuration."""
 
     @staticmethod
+    @lru_cache
     def _logging_helper() -> str:
         return (helpers_dir / "logging_helper.py").read_text()
 
     @staticmethod
+    @lru_cache
     def _logging_reload_helper() -> str:
         return (helpers_dir / "logging_reload_helper.py").read_text()
 
     @staticmethod
-    def _create_clean_project(tmp_dir: Path, is_mixed: bool) -> Path:
+    def _create_clean_project(
+        tmp_dir: Path, is_mixed: bool, lib_transform: Optional[Callable[[str], str]] = None
+    ) -> Path:
+        """create a project to test the logging of, optionally mutating the rust source.
+
+        applying `lib_transform` to the cached source and writing the result once avoids
+        the callers having to read back and rewrite the file that was just written
+        """
         _uninstall("test-project")
         project_dir = _create_project_from_blank_template("test-project", tmp_dir / "test-project", mixed=is_mixed)
         _install_editable(project_dir)
         assert _is_editable_installed_correctly("test-project", project_dir, is_mixed)
 
-        lib_path = project_dir / "src/lib.rs"
-        lib_src = lib_path.read_text().replace("_m:", "m:").replace("Ok(())", 'm.add("value", 10)?;Ok(())')
-        lib_path.write_text(lib_src)
+        lib_src = _logging_lib_src()
+        if lib_transform is not None:
+            lib_src = lib_transform(lib_src)
+        (project_dir / "src/lib.rs").write_text(lib_src)
 
         return project_dir
 
@@ -1081,8 +902,7 @@ class TestLogging:
         self._create_clean_project(workspace, is_mixed)
 
         output, _ = run_python_code(self._logging_helper())
-        pattern = 'building "test_project"\nrebuilt and loaded package "test_project" in [0-9.]+s\nvalue 10\nSUCCESS\n'
-        check_match(output, pattern, flags=re.MULTILINE)
+        check_match(output, _DEFAULT_REBUILD_PATTERN)
 
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_default_up_to_date(self, workspace: Path, is_mixed: bool) -> None:
@@ -1097,24 +917,10 @@ class TestLogging:
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_default_compile_error(self, workspace: Path, is_mixed: bool) -> None:
         """If compilation fails then the error message from maturin is printed and an ImportError is raised."""
-        project_dir = self._create_clean_project(workspace / "project", is_mixed)
-
-        lib_path = project_dir / "src/lib.rs"
-        lib_path.write_text(lib_path.read_text().replace("Ok(())", ""))
+        self._create_clean_project(workspace / "project", is_mixed, lib_transform=lambda s: s.replace("Ok(())", ""))
 
         output, _ = run_python_code(self._logging_helper())
-        pattern = (
-            'building "test_project"\n'
-            'maturin_import_hook \\[ERROR\\] command ".*" returned non-zero exit status: 1\n'
-            "maturin_import_hook \\[ERROR\\] maturin output:\n"
-            ".*"
-            "expected `Result<\\(\\), PyErr>`, found `\\(\\)`"
-            ".*"
-            "maturin failed"
-            ".*"
-            "caught MaturinError\\('Failed to build package with maturin'\\)\n"
-        )
-        check_match(output, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output, _DEFAULT_COMPILE_ERROR_PATTERN)
 
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_default_compile_warning(self, workspace: Path, is_mixed: bool) -> None:
@@ -1122,52 +928,26 @@ class TestLogging:
         If the module is already up to date but warnings were raised when it was first
         built, the warnings will be printed again.
         """
-        project_dir = self._create_clean_project(workspace / "project", is_mixed)
-        lib_path = project_dir / "src/lib.rs"
-        lib_path.write_text(lib_path.read_text().replace("Ok(())", "#[warn(unused_variables)]{let x = 12;}; Ok(())"))
+        self._create_clean_project(
+            workspace / "project",
+            is_mixed,
+            lib_transform=lambda s: s.replace("Ok(())", "#[warn(unused_variables)]{let x = 12;}; Ok(())"),
+        )
 
         output1, _ = run_python_code(self._logging_helper())
         output1 = remove_ansii_escape_characters(output1)
-        pattern = (
-            'building "test_project"\n'
-            'maturin_import_hook \\[WARNING\\] build of "test_project" succeeded with warnings:\n'
-            ".*"
-            "warning: unused variable: `x`"
-            ".*"
-            'rebuilt and loaded package "test_project" in [0-9.]+s\n'
-            "value 10\n"
-            "SUCCESS\n"
-        )
-        check_match(output1, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output1, _DEFAULT_COMPILE_WARNING_REBUILD_PATTERN)
 
         output2, _ = run_python_code(self._logging_helper())
         output2 = remove_ansii_escape_characters(output2)
-        pattern = (
-            'maturin_import_hook \\[WARNING\\] the last build of "test_project" succeeded with warnings:\n'
-            ".*"
-            "warning: unused variable: `x`"
-            ".*"
-            "value 10\n"
-            "SUCCESS\n"
-        )
-        check_match(output2, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output2, _DEFAULT_COMPILE_WARNING_UP_TO_DATE_PATTERN)
 
     @pytest.mark.skipif(not RELOAD_SUPPORTED, reason="reload not supported")
     def test_reload(self, workspace: Path) -> None:
         self._create_clean_project(workspace, is_mixed=False)
 
         output, _ = run_python_code(self._logging_reload_helper())
-        pattern = (
-            "reload start\n"
-            'building "test_project"\n'
-            'rebuilt and loaded package "test_project" in [0-9.]+s\n'
-            "reload finish\n"
-            "reload start\n"
-            "reload finish\n"
-            "value 10\n"
-            "SUCCESS\n"
-        )
-        check_match(output, pattern, flags=re.MULTILINE)
+        check_match(output, _LOGGING_RELOAD_PATTERN)
 
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_reset_logger_without_configuring(self, workspace: Path, is_mixed: bool) -> None:
@@ -1181,38 +961,25 @@ class TestLogging:
     @pytest.mark.parametrize("is_mixed", [False, True])
     def test_successful_compilation_but_not_valid(self, workspace: Path, is_mixed: bool) -> None:
         """If the project compiles but does not import correctly an ImportError is raised."""
-        project_dir = self._create_clean_project(workspace / "project", is_mixed)
-        lib_path = project_dir / "src/lib.rs"
-        lib_path.write_text(lib_path.read_text().replace("test_project", "test_project_new_name"))
+        self._create_clean_project(
+            workspace / "project", is_mixed, lib_transform=lambda s: s.replace("test_project", "test_project_new_name")
+        )
 
         output, _ = run_python_code(self._logging_helper(), quiet=True)
-        pattern = (
-            'building "test_project"\n'
-            'rebuilt and loaded package "test_project" in [0-9.]+s\n'
-            f"caught ImportError\\('{missing_entrypoint_error_message_pattern('test_project')}'\\)\n"
-        )
-        check_match(output, pattern, flags=re.MULTILINE)
+        check_match(output, _successful_compilation_but_not_valid_pattern())
 
 
 class TestDefaultProjectFileSearcher:
     class TestGetSourcePaths:
         def test_missing_extension(self, workspace: Path) -> None:
-            s = DefaultProjectFileSearcher(
-                source_excluded_dir_names=set(),
-                source_excluded_dir_markers=set(),
-                source_excluded_file_extensions=set(),
-            )
+            s = _EMPTY_SEARCHER
             assert list(s.get_source_paths(workspace, [], workspace / "missing")) == []
             extension_dir = workspace / "extension"
             extension_dir.mkdir()
             assert list(s.get_source_paths(workspace, [], extension_dir)) == []
 
         def test_missing_paths(self, workspace: Path) -> None:
-            s = DefaultProjectFileSearcher(
-                source_excluded_dir_names=set(),
-                source_excluded_dir_markers=set(),
-                source_excluded_file_extensions=set(),
-            )
+            s = _EMPTY_SEARCHER
             (workspace / "extension").touch()
             with pytest.raises(FileNotFoundError):
                 list(s.get_source_paths(workspace, [workspace / "missing"], workspace / "extension"))
@@ -1221,11 +988,7 @@ class TestDefaultProjectFileSearcher:
                 list(s.get_source_paths(workspace / "missing", [], workspace / "extension"))
 
         def test_simple(self, workspace: Path) -> None:
-            s = DefaultProjectFileSearcher(
-                source_excluded_dir_names=set(),
-                source_excluded_dir_markers=set(),
-                source_excluded_file_extensions=set(),
-            )
+            s = _EMPTY_SEARCHER
             src_dir = workspace / "src"
             src_dir.mkdir()
             source_file_path = src_dir / "source_file.rs"
@@ -1263,11 +1026,7 @@ class TestDefaultProjectFileSearcher:
             (project_b / "__pycache__").mkdir()
             (project_b / "__pycache__/source.pyc").touch()
 
-            s = DefaultProjectFileSearcher(
-                source_excluded_dir_names=set(),
-                source_excluded_dir_markers=set(),
-                source_excluded_file_extensions=set(),
-            )
+            s = _EMPTY_SEARCHER
             paths = set(s.get_source_paths(project_a, [project_b], extension_dir))
             assert paths == {project_a / "source.py", project_b / "source.py", project_b / "__pycache__/source.pyc"}
 
@@ -1297,11 +1056,7 @@ class TestDefaultProjectFileSearcher:
             extension_path = installed_dir / "extension"
             extension_path.touch()
 
-            s = DefaultProjectFileSearcher(
-                source_excluded_dir_names=set(),
-                source_excluded_dir_markers=set(),
-                source_excluded_file_extensions=set(),
-            )
+            s = _EMPTY_SEARCHER
             paths = set(s.get_source_paths(project_dir, [], extension_path))
             assert paths == {project_dir / "source"}
 
@@ -1332,10 +1087,313 @@ class TestDefaultProjectFileSearcher:
         }
 
 
+def _append_text(path: Path, text: str) -> None:
+    """append to the given file without re-reading and re-writing the existing content"""
+    with path.open("a") as f:
+        f.write(text)
+
+
+_REBUILT_MY_PROJECT_PATTERN = 'maturin_import_hook \\[INFO\\] rebuilt and loaded package "my_project" in [0-9.]+s'
+"""the one non-literal line in the expected reload log output (the build time varies)"""
+
+
+@lru_cache
+def _basic_reload_expected_info_pattern(*, is_mixed: bool) -> "re.Pattern[str]":
+    """the pattern is a pure function of `is_mixed` so is constructed and compiled once per
+    parametrization rather than on every invocation of `test_basic_reload`
+    """
+    e = re.escape
+    expected_info_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e('maturin_import_hook [INFO] building "my_project"'),  # because: no build status
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] initial import finish"),
+        e("root [INFO] comparing Integer instances a and b"),
+        e("root [INFO] comparing Integer instances a and c"),
+        e("reload_helper [INFO] modifying project"),
+        e("reload_helper [INFO] reload 1 start"),
+        e('maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload 1 finish"),
+        e("root [INFO] comparing Integer instances d and e"),
+        e("reload_helper [INFO] reload 2 start"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload 2 finish"),
+        e("reload_helper [INFO] modifying project"),
+        e("reload_helper [INFO] reload 3 start"),
+        e('maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload 3 finish"),
+        e("reload_helper [INFO] reload 4 start"),
+        e("reload_helper [INFO] reload 4 finish"),
+        e("reload_helper [INFO] SUCCESS"),
+    ]
+    return re.compile("\n".join(line for line in expected_info_parts if line), re.MULTILINE)
+
+
+@lru_cache
+def _globals_expected_info_pattern() -> "re.Pattern[str]":
+    e = re.escape
+    expected_info_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e('maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised"),
+        e("root [INFO] my_project other_module initialised"),
+        e("reload_helper [INFO] initial import finish"),
+        e("reload_helper [INFO] checking extension module"),
+        e("reload_helper [INFO] checking root module"),
+        e("reload_helper [INFO] checking other_module"),
+        e("reload_helper [INFO] reload 1 start"),
+        e("root [INFO] my_project __init__ initialised"),
+        e("reload_helper [INFO] reload 2 finish"),
+        e("reload_helper [INFO] checking extension module"),
+        e("reload_helper [INFO] checking root module"),
+        e("reload_helper [INFO] checking other_module"),
+        e("reload_helper [INFO] modifying project"),
+        e("reload_helper [INFO] reload 2 start"),
+        e('maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised"),
+        e("reload_helper [INFO] reload 2 finish"),
+        e("reload_helper [INFO] checking extension module"),
+        e("reload_helper [INFO] checking root module"),
+        e("reload_helper [INFO] checking other_module"),
+        e("reload_helper [INFO] SUCCESS"),
+    ]
+    return re.compile("\n".join(expected_info_parts), re.MULTILINE)
+
+
+@lru_cache
+def _other_module_expected_info_pattern() -> "re.Pattern[str]":
+    e = re.escape
+    expected_info_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e('maturin_import_hook [INFO] building "my_project"'),  # because: no build status
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised"),
+        e("root [INFO] my_project other_module initialised"),
+        e("reload_helper [INFO] initial import finish"),
+        e("reload_helper [INFO] modifying project"),
+        e("reload_helper [INFO] reload other_module start"),
+        e("root [INFO] my_project other_module initialised"),
+        e("reload_helper [INFO] reload other_module finish"),
+        e("reload_helper [INFO] reload package start"),
+        e('maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised"),
+        e("reload_helper [INFO] reload package finish"),
+        e("reload_helper [INFO] reload other_module start"),
+        e("root [INFO] my_project other_module initialised"),
+        e("reload_helper [INFO] reload other_module finish"),
+        e("reload_helper [INFO] SUCCESS"),
+    ]
+    return re.compile("\n".join(expected_info_parts), re.MULTILINE)
+
+
+@lru_cache
+def _reload_without_import_hook_expected_pattern(*, is_mixed: bool) -> "re.Pattern[str]":
+    e = re.escape
+    expected_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] initial import finish"),
+        e("reload_helper [INFO] reload package start"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload package finish"),
+        e("reload_helper [INFO] installing import hook"),
+        e("reload_helper [INFO] modifying project"),
+        e("reload_helper [INFO] reload package start"),
+        e('maturin_import_hook [DEBUG] package "my_project" is already loaded and enable_reloading=False'),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload package finish"),
+        e("reload_helper [INFO] reload extension module start"),
+        e("reload_helper [INFO] reload extension module finish"),
+        e("reload_helper [INFO] uninstalling import hook"),
+        e("reload_helper [INFO] reload package start"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload package finish"),
+        e("reload_helper [INFO] SUCCESS\n"),
+    ]
+    return re.compile("\n".join(line for line in expected_parts if line), re.MULTILINE)
+
+
+@lru_cache
+def _install_after_import_expected_info_pattern(*, is_mixed: bool) -> "re.Pattern[str]":
+    e = re.escape
+    expected_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] initial import finish"),
+        e("reload_helper [INFO] installing import hook"),
+        e("reload_helper [INFO] modifying project"),
+        e("reload_helper [INFO] reload start"),
+        e('maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_MY_PROJECT_PATTERN,
+        e("root [INFO] my_project extension module initialised"),
+        e("root [INFO] my_project __init__ initialised" if is_mixed else ""),
+        e("reload_helper [INFO] reload finish"),
+        e("reload_helper [INFO] SUCCESS"),
+    ]
+    return re.compile("\n".join(line for line in expected_parts if line), re.MULTILINE)
+
+
+_REBUILT_RE_PART = ("re", _REBUILT_MY_PROJECT_PATTERN)
+
+
+@lru_cache
+def _compilation_error_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project"'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_project extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying project"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        ("lit", "expected expression, found `;`"),
+        ("lit", "maturin failed"),
+        ("lit", "reload_helper [INFO] reload failed"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] modifying project"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_RE_PART,
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+@lru_cache
+def _pickling_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project"'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_project extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying project"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_RE_PART,
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+@lru_cache
+def _submodule_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project"'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_project extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying project"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinProjectImporter searching for "my_project" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_project"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_project extension module initialised"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", "reload_helper [INFO] reload failed"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+_DEFAULT_REBUILD_PATTERN = re.compile(
+    'building "test_project"\nrebuilt and loaded package "test_project" in [0-9.]+s\nvalue 10\nSUCCESS\n', re.MULTILINE
+)
+
+_DEFAULT_COMPILE_ERROR_PATTERN = re.compile(
+    'building "test_project"\n'
+    'maturin_import_hook \\[ERROR\\] command ".*?" returned non-zero exit status: 1\n'
+    "maturin_import_hook \\[ERROR\\] maturin output:\n"
+    ".*?"
+    "expected `Result<\\(\\), PyErr>`, found `\\(\\)`"
+    ".*?"
+    "maturin failed"
+    ".*?"
+    "caught MaturinError\\('Failed to build package with maturin'\\)\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+_DEFAULT_COMPILE_WARNING_REBUILD_PATTERN = re.compile(
+    'building "test_project"\n'
+    'maturin_import_hook \\[WARNING\\] build of "test_project" succeeded with warnings:\n'
+    ".*?"
+    "warning: unused variable: `x`"
+    ".*?"
+    'rebuilt and loaded package "test_project" in [0-9.]+s\n'
+    "value 10\n"
+    "SUCCESS\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+_DEFAULT_COMPILE_WARNING_UP_TO_DATE_PATTERN = re.compile(
+    'maturin_import_hook \\[WARNING\\] the last build of "test_project" succeeded with warnings:\n'
+    ".*?"
+    "warning: unused variable: `x`"
+    ".*?"
+    "value 10\n"
+    "SUCCESS\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+_LOGGING_RELOAD_PATTERN = re.compile(
+    "reload start\n"
+    'building "test_project"\n'
+    'rebuilt and loaded package "test_project" in [0-9.]+s\n'
+    "reload finish\n"
+    "reload start\n"
+    "reload finish\n"
+    "value 10\n"
+    "SUCCESS\n",
+    re.MULTILINE,
+)
+
+
+@lru_cache
+def _successful_compilation_but_not_valid_pattern() -> "re.Pattern[str]":
+    """compiled lazily because the expected missing entrypoint message depends on the platform"""
+    return re.compile(
+        'building "test_project"\n'
+        'rebuilt and loaded package "test_project" in [0-9.]+s\n'
+        f"caught ImportError\\('{missing_entrypoint_error_message_pattern('test_project')}'\\)\n",
+        re.MULTILINE,
+    )
+
+
+@lru_cache
 def _up_to_date_message(project_name: str) -> str:
     return f'package up to date: "{with_underscores(project_name)}"'
 
 
+@lru_cache
 def _rebuilt_message(project_name: str) -> str:
     return f'rebuilt and loaded package "{with_underscores(project_name)}"'
 
@@ -1359,6 +1417,15 @@ def get_package_installer() -> PackageInstaller:
 
 def _uninstall(*project_names: str) -> None:
     log.info("uninstalling %s", sorted(project_names))
+    # scanning the package metadata in-process is much cheaper than spawning the package
+    # manager just to discover that there is nothing to uninstall (the usual case since
+    # the _reset_virtualenv fixture uninstalls the packages installed by each test)
+    importlib.invalidate_caches()
+    installed = {_canonical_package_name(name) for name in _get_installed_package_names_in_process()}
+    project_names = tuple(name for name in project_names if _canonical_package_name(name) in installed)
+    if not project_names:
+        log.info("none of the packages are installed. nothing to do")
+        return
     installer = get_package_installer()
     if installer == PackageInstaller.UV:
         cmd = ["uv", "pip", "uninstall", "--python", str(sys.executable), *project_names]
@@ -1369,31 +1436,27 @@ def _uninstall(*project_names: str) -> None:
             "pip",
             "uninstall",
             "--disable-pip-version-check",
+            "--no-input",
             "-y",
             *project_names,
         ]
     else:
         raise ValueError(installer)
     subprocess.check_call(cmd)
+    _invalidate_install_caches()
 
 
-def _get_installed_package_names() -> set[str]:
-    installer = get_package_installer()
-    if installer == PackageInstaller.UV:
-        cmd = ["uv", "pip", "list", "--python", sys.executable, "--format", "json"]
-    elif installer == PackageInstaller.PIP:
-        cmd = [
-            sys.executable,
-            "-m",
-            "pip",
-            "--disable-pip-version-check",
-            "list",
-            "--format=json",
-        ]
-    else:
-        raise ValueError(installer)
-    packages = json.loads(subprocess.check_output(cmd).decode())
-    return {package["name"] for package in packages}
+def _canonical_package_name(name: str) -> str:
+    return name.lower().replace("_", "-")
+
+
+def _get_installed_package_names_in_process() -> set[str]:
+    # imported here rather than at module scope since importlib.metadata is relatively
+    # expensive to import and is not needed at collection time
+    import importlib.metadata
+
+    names = (dist.metadata["Name"] for dist in importlib.metadata.distributions())
+    return {name for name in names if name is not None}
 
 
 def _install_editable(project_dir: Path) -> None:
@@ -1404,10 +1467,13 @@ def _install_editable(project_dir: Path) -> None:
     assert maturin_path is not None
     env = os.environ.copy()
     env["VIRTUAL_ENV"] = sys.exec_prefix
+    # skip pip's version self-check (may hit the network) when maturin invokes it
+    env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
     args = [maturin_path, "develop"]
     if get_package_installer() == PackageInstaller.UV:
         args.append("--uv")
     subprocess.check_call(args, cwd=project_dir, env=env)
+    _invalidate_install_caches()
 
 
 def _install_non_editable(project_dir: Path) -> None:
@@ -1420,31 +1486,51 @@ def _install_non_editable(project_dir: Path) -> None:
     else:
         raise ValueError(installer)
     subprocess.check_call(cmd)
+    _invalidate_install_caches()
 
 
-def _is_installed_as_pth(project_name: str) -> bool:
-    package_name = with_underscores(project_name)
-    return any((Path(path) / f"{package_name}.pth").exists() for path in site.getsitepackages())
+@lru_cache
+def _site_packages_paths() -> tuple[Path, ...]:
+    """site.getsitepackages() re-runs path resolution on every call and the result never
+    changes, so look it up once
+    """
+    return tuple(Path(path) for path in site.getsitepackages())
 
 
-def _is_installed_editable_with_direct_url(project_name: str, project_dir: Path) -> bool:
-    package_name = with_underscores(project_name)
-    for path in site.getsitepackages():
-        linked_path, is_editable = _load_dist_info(Path(path), package_name)
+@lru_cache
+def _load_dist_info_cached(path: Path, package_name: str) -> tuple[Optional[Path], bool]:
+    """cached _load_dist_info. Every helper that modifies the installed packages must call
+    _invalidate_install_caches()
+    """
+    return _load_dist_info(path, package_name)
+
+
+def _invalidate_install_caches() -> None:
+    _load_dist_info_cached.cache_clear()
+
+
+def _is_installed_as_pth(package_name: str) -> bool:
+    return any(os.path.exists(os.path.join(path, f"{package_name}.pth")) for path in _site_packages_paths())
+
+
+def _is_installed_editable_with_direct_url(package_name: str, project_dir: Path) -> bool:
+    for path in _site_packages_paths():
+        linked_path, is_editable = _load_dist_info_cached(path, package_name)
         if linked_path == project_dir:
             if not is_editable:
-                log.info('project "%s" is installed but not in editable mode', project_name)
+                log.info('package "%s" is installed but not in editable mode', package_name)
             return is_editable
         elif linked_path is not None:
-            log.info('found linked path "%s" for project "%s". Expected "%s"', linked_path, project_name, project_dir)
+            log.info('found linked path "%s" for package "%s". Expected "%s"', linked_path, package_name, project_dir)
             return False
     return False
 
 
 def _is_editable_installed_correctly(project_name: str, project_dir: Path, is_mixed: bool) -> bool:
     log.info("checking if %s is installed correctly", project_name)
-    installed_as_pth = _is_installed_as_pth(project_name)
-    installed_editable_with_direct_url = _is_installed_editable_with_direct_url(project_name, project_dir)
+    package_name = with_underscores(project_name)
+    installed_as_pth = _is_installed_as_pth(package_name)
+    installed_editable_with_direct_url = _is_installed_editable_with_direct_url(package_name, project_dir)
     log.info(
         "is_mixed=%s, installed_as_pth=%s installed_editable_with_direct_url=%s",
         is_mixed,
@@ -1452,32 +1538,45 @@ def _is_editable_installed_correctly(project_name: str, project_dir: Path, is_mi
         installed_editable_with_direct_url,
     )
 
-    installer = get_package_installer()
-    if installer == PackageInstaller.UV:
-        # TODO(matt): use uv once the --files option is supported https://github.com/astral-sh/uv/issues/2526
-        cmd = [sys.executable, "-m", "pip", "show", "--disable-pip-version-check", "-f", project_name]
-    elif installer == PackageInstaller.PIP:
-        cmd = [sys.executable, "-m", "pip", "show", "--disable-pip-version-check", "-f", project_name]
-    else:
-        raise ValueError(installer)
+    # the metadata is logged for diagnostics only. Reading it in-process is much cheaper
+    # than spawning `pip show --files` (which pays a full interpreter and pip startup)
+    import importlib.metadata
 
-    proc = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        check=False,
-    )
-    output = "None" if proc.stdout is None else proc.stdout.decode()
-    log.info("command output (returned %s):\n%s", proc.returncode, output)
+    try:
+        dist = importlib.metadata.distribution(with_underscores(project_name))
+    except importlib.metadata.PackageNotFoundError:
+        log.info('no package metadata found for "%s"', project_name)
+    else:
+        files = "None" if dist.files is None else "\n".join(str(file) for file in dist.files)
+        log.info("version: %s\nfiles:\n%s", dist.version, files)
     return installed_editable_with_direct_url and (installed_as_pth == is_mixed)
 
 
+def _create_project_copies(*specs: tuple[Path, Path]) -> list[Path]:
+    """copy several projects at once. The copies are independent and IO-bound so they are
+    dispatched to a thread pool
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = [source for source, _ in specs]
+    outputs = [output for _, output in specs]
+    with ThreadPoolExecutor(len(specs)) as executor:
+        return list(executor.map(_get_project_copy, sources, outputs))
+
+
 def _get_project_copy(project_dir: Path, output_path: Path, *, use_git: bool = True) -> Path:
-    paths = _get_relative_files_tracked_by_git(project_dir) if use_git else _get_relative_files(project_dir)
+    """copy the clean files of the given project to output_path.
+
+    the working-tree contents are copied file by file rather than extracting
+    `git archive HEAD`, so that uncommitted changes to the source tree are included and
+    so the cached file listing is reused instead of spawning git for every copy
+    """
+    paths = _get_relative_files_tracked_by_git(project_dir) if use_git else tuple(_get_relative_files(project_dir))
+    # create each unique parent directory once instead of issuing a mkdir per file
+    for parent in {(output_path / relative_path).parent for relative_path in paths}:
+        parent.mkdir(parents=True, exist_ok=True)
     for relative_path in paths:
-        output_file_path = output_path / relative_path
-        output_file_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(project_dir / relative_path, output_file_path)
+        shutil.copy(project_dir / relative_path, output_path / relative_path)
     return output_path
 
 
@@ -1487,25 +1586,64 @@ def _get_relative_files(root: Path) -> Iterator[Path]:
             yield p.relative_to(root)
 
 
-def _get_relative_files_tracked_by_git(root: Path) -> Iterator[Path]:
-    """This is used to ignore built artifacts to create a clean copy."""
-    output = subprocess.check_output(["git", "ls-tree", "--name-only", "-z", "-r", "HEAD"], cwd=root)
-    for relative_path_bytes in output.split(b"\x00"):
-        relative_path = Path(os.fsdecode(relative_path_bytes))
-        if (root / relative_path).is_file():
-            yield relative_path
+@lru_cache
+def _get_relative_files_tracked_by_git(root: Path) -> tuple[Path, ...]:
+    """This is used to ignore built artifacts to create a clean copy.
+
+    The result is cached since the source trees (the blank project template and the
+    maturin test crates) do not change while the tests run, so each copy after the first
+    avoids spawning git again.
+    """
+    # `-C` instead of `cwd=` keeps the child spawn on the fast posix_spawn path
+    # (passing cwd forces subprocess to fork so it can chdir before exec)
+    output = subprocess.check_output(["git", "-C", str(root), "ls-tree", "-z", "-r", "HEAD"])
+    relative_paths = []
+    for entry in output.split(b"\x00"):
+        # each entry is formatted "<mode> <type> <hash>\t<path>"
+        info, _, path_bytes = entry.partition(b"\t")
+        # take only blobs (files), skipping submodules and anything else git tracks
+        if path_bytes and info.split(b" ")[1] == b"blob":
+            relative_paths.append(Path(os.fsdecode(path_bytes)))
+    return tuple(relative_paths)
+
+
+_BLANK_PROJECT_NAME_REGEX = re.compile(r"blank[-_]project")
+
+
+@lru_cache
+def _rendered_blank_template_files(project_name: str) -> tuple[tuple[str, bytes], ...]:
+    """the blank-project template files with the project name substituted.
+
+    the template does not change while the tests run, so for each project name the
+    read + substitution passes only happen for the first copy
+    """
+    package_name = project_name.replace("-", "_")
+    replacements = {"blank-project": project_name, "blank_project": package_name}
+    rendered = []
+    for relative_path in ("pyproject.toml", "Cargo.toml", "src/lib.rs"):
+        text = (helpers_dir / "blank-project" / relative_path).read_text()
+        # a single substitution pass instead of two chained str.replace copies
+        rendered.append((relative_path, _BLANK_PROJECT_NAME_REGEX.sub(lambda m: replacements[m.group()], text).encode()))
+    return tuple(rendered)
+
+
+@lru_cache
+def _logging_lib_src() -> str:
+    """the lib.rs source that `TestLogging` writes into its test project: the blank
+    template with a `value` attribute added. derived from the cached template text
+    instead of reading back the file that `_create_project_from_blank_template` wrote
+    """
+    files = dict(_rendered_blank_template_files("test-project"))
+    lib_src = files["src/lib.rs"].decode()
+    return lib_src.replace("_m:", "m:").replace("Ok(())", 'm.add("value", 10)?;Ok(())')
 
 
 def _create_project_from_blank_template(project_name: str, output_path: Path, *, mixed: bool) -> Path:
     project_dir = _get_project_copy(helpers_dir / "blank-project", output_path)
     project_name = project_name.replace("_", "-")
     package_name = project_name.replace("-", "_")
-    for path in [
-        project_dir / "pyproject.toml",
-        project_dir / "Cargo.toml",
-        project_dir / "src/lib.rs",
-    ]:
-        path.write_text(path.read_text().replace("blank-project", project_name).replace("blank_project", package_name))
+    for relative_path, rendered_bytes in _rendered_blank_template_files(project_name):
+        (project_dir / relative_path).write_bytes(rendered_bytes)
     if mixed:
         (project_dir / package_name).mkdir()
         (project_dir / package_name / "__init__.py").write_text(f"from .{package_name} import *")
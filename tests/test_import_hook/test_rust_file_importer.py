@@ -1,16 +1,18 @@
 import os
 import platform
 import re
-import shutil
 import sys
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
-from textwrap import dedent
+from typing import Optional
 
 import pytest
 
 from .common import (
     RELOAD_SUPPORTED,
     check_match,
+    check_match_fast,
     create_echo_script,
     get_file_times,
     get_string_between,
@@ -32,6 +34,27 @@ script_dir = Path(__file__).parent.resolve()
 helpers_dir = script_dir / "file_importer_helpers"
 
 
+@lru_cache
+def _helper_bytes(name: str) -> bytes:
+    """the contents of a file in helpers_dir, cached because several tests copy the same
+    template files into their workspaces
+    """
+    return (helpers_dir / name).read_bytes()
+
+
+def _copy_helper(name: str, destination: Path) -> Path:
+    """copy a file from helpers_dir to the given path, re-reading it only on the first copy"""
+    destination.write_bytes(_helper_bytes(name))
+    return destination
+
+
+@lru_cache
+def _rendered_settings_helper(project_name: str) -> bytes:
+    """rebuild_on_settings_change_helper.py with the project name substituted, rendered once per name"""
+    template = _helper_bytes("rebuild_on_settings_change_helper.py").decode()
+    return template.replace("PROJECT_NAME", project_name).encode()
+
+
 def test_absolute_import(workspace: Path) -> None:
     """Test imports of the form `import ab.cd.ef`."""
     helper_path = helpers_dir / "absolute_import_helper.py"
@@ -81,14 +104,25 @@ def test_top_level_import(workspace: Path) -> None:
     assert duration2 < duration1
 
 
+_MULTIPLE_IMPORT_TOKENS = re.compile(
+    'SUCCESS|rebuilt and loaded module "packages\\.subpackage\\.my_rust_module"|importing rust file'
+)
+"""every marker examined by test_multiple_imports, located with one scan of the output"""
+
+
 def test_multiple_imports(workspace: Path) -> None:
     """Test importing the same rs file multiple times by different names in the same session."""
     helper_path = helpers_dir / "multiple_import_helper.py"
 
     output, _ = run_python([str(helper_path)], cwd=workspace)
-    assert "SUCCESS" in output
-    assert 'rebuilt and loaded module "packages.subpackage.my_rust_module"' in output
-    assert output.count("importing rust file") == 1
+    found = _MULTIPLE_IMPORT_TOKENS.findall(output)
+    assert "SUCCESS" in found
+    assert 'rebuilt and loaded module "packages.subpackage.my_rust_module"' in found
+    assert found.count("importing rust file") == 1
+
+
+_CONCURRENT_IMPORT_TOKENS = re.compile("SUCCESS|importing rust file|waiting on lock|creating project for|module up to date")
+"""every marker examined by test_concurrent_import, located with one scan per output"""
 
 
 def test_concurrent_import() -> None:
@@ -111,13 +145,14 @@ def test_concurrent_import() -> None:
     num_up_to_date = 0
     num_waiting = 0
     for output in outputs:
-        assert "SUCCESS" in output.output
-        assert "importing rust file" in output.output
-        if "waiting on lock" in output.output:
+        found = set(_CONCURRENT_IMPORT_TOKENS.findall(output.output))
+        assert "SUCCESS" in found
+        assert "importing rust file" in found
+        if "waiting on lock" in found:
             num_waiting += 1
-        if "creating project for" in output.output:
+        if "creating project for" in found:
             num_compilations += 1
-        if "module up to date" in output.output:
+        if "module up to date" in found:
             num_up_to_date += 1
 
     assert num_compilations == 1
@@ -128,9 +163,9 @@ def test_concurrent_import() -> None:
 def test_rebuild_on_change(workspace: Path) -> None:
     """Test that modules are rebuilt if they are edited."""
     script_path = workspace / "my_script.rs"
-    helper_path = shutil.copy(helpers_dir / "rebuild_on_change_helper.py", workspace)
+    helper_path = _copy_helper("rebuild_on_change_helper.py", workspace / "rebuild_on_change_helper.py")
 
-    shutil.copy(helpers_dir / "my_script_1.rs", script_path)
+    _copy_helper("my_script_1.rs", script_path)
 
     output1, _ = run_python([str(helper_path)], cwd=workspace)
     assert "get_num = 10" in output1
@@ -140,7 +175,7 @@ def test_rebuild_on_change(workspace: Path) -> None:
     assert "module up to date" not in output1
     assert "creating project for" in output1
 
-    shutil.copy(helpers_dir / "my_script_2.rs", script_path)
+    _copy_helper("my_script_2.rs", script_path)
 
     output2, _ = run_python([str(helper_path)], cwd=workspace)
     assert "get_num = 20" in output2
@@ -165,9 +200,9 @@ def test_low_resolution_mtime(workspace: Path) -> None:
     if the content of the extension module is up to date and therefore not modified.
     """
     script_path = workspace / "my_script.rs"
-    helper_path = shutil.copy(helpers_dir / "low_resolution_mtime_helper.py", workspace)
+    helper_path = _copy_helper("low_resolution_mtime_helper.py", workspace / "low_resolution_mtime_helper.py")
 
-    shutil.copy(helpers_dir / "my_script_1.rs", script_path)
+    _copy_helper("my_script_1.rs", script_path)
 
     output1, _ = run_python([str(helper_path)], cwd=workspace)
     assert 'building "my_script"' in output1
@@ -181,10 +216,8 @@ def test_low_resolution_mtime(workspace: Path) -> None:
     # made shortly after the extension module is built. The time window for this problem to occur varies
     # depending on the filesystem. The problem can also occur in reverse (built immediately after an edit) but this
     # is less likely since building takes significant time.
-    shutil.copy(helpers_dir / "my_script_2.rs", script_path)
-    times = get_file_times(extension_path)
-    set_file_times(script_path, times)
-    set_file_times(extension_path, times)
+    _copy_helper("my_script_2.rs", script_path)
+    set_file_times(script_path, get_file_times(extension_path))
 
     output2, _ = run_python([str(helper_path)], cwd=workspace)
     assert 'building "my_script"' in output2
@@ -195,9 +228,7 @@ def test_low_resolution_mtime(workspace: Path) -> None:
     # this time, the mtimes are identical but nothing has changed. A rebuild should be triggered and even if the
     # extension module is unchanged the mtime of the extension module should be updated to prevent any more
     # unnecessary rebuilds
-    times = get_file_times(extension_path)
-    set_file_times(script_path, times)
-    set_file_times(extension_path, times)
+    set_file_times(script_path, get_file_times(extension_path))
 
     output3, _ = run_python([str(helper_path)], cwd=workspace)
     assert 'building "my_script"' in output3
@@ -208,7 +239,7 @@ def test_low_resolution_mtime(workspace: Path) -> None:
     extension_stat = extension_path.stat()
     source_code_stat = script_path.stat()
     # extension mtime should be strictly greater to remove the ambiguity about which is newer
-    assert source_code_stat.st_mtime < extension_stat.st_mtime
+    assert source_code_stat.st_mtime_ns < extension_stat.st_mtime_ns
 
     output4, _ = run_python([str(helper_path)], cwd=workspace)
     assert 'building "my_script"' not in output4
@@ -220,11 +251,9 @@ def test_rebuild_on_settings_change(workspace: Path) -> None:
     """Test that modules are rebuilt if the settings (eg maturin flags) used by the import hook changes."""
     script_path = workspace / "my_script.rs"
     helper_path = workspace / "helper.py"
-    helper_path.write_text(
-        (helpers_dir / "rebuild_on_settings_change_helper.py").read_text().replace("PROJECT_NAME", "my_script")
-    )
+    helper_path.write_bytes(_rendered_settings_helper("my_script"))
 
-    shutil.copy(helpers_dir / "my_script_3.rs", script_path)
+    _copy_helper("my_script_3.rs", script_path)
 
     output1, _ = run_python([str(helper_path)], cwd=workspace)
     assert "get_num = 10" in output1
@@ -252,6 +281,23 @@ def test_rebuild_on_settings_change(workspace: Path) -> None:
     assert "SUCCESS" in output4
 
 
+_OTHER_MODULE_SRC = """\
+import my_module
+from my_module import get_num
+import logging
+
+def get_twice_num_direct():
+    return get_num() * 2
+
+def get_twice_num_indirect():
+    return my_module.get_num() * 2
+
+logging.info('other module initialised')
+"""
+"""the other_module.py written by _create_reload_module, kept flush-left at module scope
+so it does not have to be dedented on every test"""
+
+
 @pytest.mark.skipif(not RELOAD_SUPPORTED, reason="reload not supported")
 class TestReload:
     """test that importlib.reload() can be used to reload modules imported by the import hook
@@ -266,22 +312,9 @@ class TestReload:
     def _create_reload_module(output_dir: Path) -> Path:
         (output_dir / "__init__.py").touch()
         module_path = output_dir / "my_module.rs"
-        shutil.copy(helpers_dir / "reload_template.rs", module_path)
-        shutil.copy(helpers_dir / "reload_helper.py", output_dir / "reload_helper.py")
-        other_module = dedent("""\
-        import my_module
-        from my_module import get_num
-        import logging
-
-        def get_twice_num_direct():
-            return get_num() * 2
-
-        def get_twice_num_indirect():
-            return my_module.get_num() * 2
-
-        logging.info('other module initialised')
-        """)
-        (output_dir / "other_module.py").write_text(other_module)
+        _copy_helper("reload_template.rs", module_path)
+        _copy_helper("reload_helper.py", output_dir / "reload_helper.py")
+        (output_dir / "other_module.py").write_text(_OTHER_MODULE_SRC)
 
         return module_path
 
@@ -311,40 +344,9 @@ class TestReload:
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
         # This checks that the INFO level logs are exactly these messages (with nothing in between).
         # This verifies that rebuilds and module initialisation are behaving as expected
-        expected_info_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [INFO] building "my_module"'),  # because: no build status
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("root [INFO] comparing Integer instances a and b"),
-            e("root [INFO] comparing Integer instances a and c"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload 1 start"),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload 1 finish"),
-            e("root [INFO] comparing Integer instances d and e"),
-            e("reload_helper [INFO] reload 2 start"),
-            e(
-                "root [INFO] my_module extension module initialised"
-            ),  # note: this is different from the package importer
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload 3 start"),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload 3 finish"),
-            e("reload_helper [INFO] SUCCESS"),
-        ]
-        expected_info_pattern = "\n".join(line for line in expected_info_parts if line)
-        check_match(info, expected_info_pattern, flags=re.MULTILINE)
+        check_match(info, _basic_reload_expected_info_pattern())
 
         # these checks ensure that the internals of the import hook are performing the expected actions
         initial_import = get_string_between(output, "initial import start", "initial import finish")
@@ -405,30 +407,7 @@ class TestReload:
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_info_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] checking extension module"),
-            e("reload_helper [INFO] reload 1 start"),
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] checking extension module"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload 2 start"),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] checking extension module"),
-            e("reload_helper [INFO] SUCCESS"),
-        ]
-        expected_info_pattern = "\n".join(line for line in expected_info_parts if line)
-        check_match(info, expected_info_pattern, flags=re.MULTILINE)
+        check_match(info, _globals_expected_info_pattern())
 
     def test_other_module(self, workspace: Path) -> None:
         module_path = self._create_reload_module(workspace)
@@ -438,30 +417,7 @@ class TestReload:
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] module "my_module" will be rebuilt because: already built module not found'),
-            e("root [INFO] my_module extension module initialised"),
-            e("root [INFO] other module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload 1 start"),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            e('maturin_import_hook [DEBUG] handling reload of "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload 1 finish"),
-            e("reload_helper [INFO] reload 2 start"),
-            e("root [INFO] other module initialised"),
-            e("reload_helper [INFO] reload 2 finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(part for part in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _other_module_expected_parts())
 
     def test_reload_without_import_hook(self, workspace: Path) -> None:
         """test when reload is used without support from the import hook"""
@@ -471,30 +427,7 @@ class TestReload:
         )
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e("reload_helper [INFO] module not found"),
-            e("reload_helper [INFO] installing import hook"),
-            e('module "my_module" will be rebuilt because: already built module not found'),
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] reload module start"),
-            e('maturin_import_hook [DEBUG] module "my_module" is already loaded and enable_reloading=False'),
-            e("reload_helper [INFO] reload module finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload module start"),
-            e('maturin_import_hook [DEBUG] module "my_module" is already loaded and enable_reloading=False'),
-            e("reload_helper [INFO] reload module finish"),
-            e("reload_helper [INFO] uninstalling import hook"),
-            e("reload_helper [INFO] reload module start"),
-            e("reload_helper [INFO] module not found"),
-            e("reload_helper [INFO] reload module finish"),
-            e("reload_helper [INFO] SUCCESS\n"),
-        ]
-        expected_pattern = ".*".join(part for part in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _reload_without_import_hook_expected_parts())
 
     def test_compilation_error(self, workspace: Path) -> None:
         module_path = self._create_reload_module(workspace)
@@ -503,36 +436,7 @@ class TestReload:
         )
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module"'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            e("expected expression, found `;`"),
-            e("maturin failed"),
-            e("reload_helper [INFO] reload failed"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(line for line in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _compilation_error_expected_parts())
 
     def test_pickling(self, workspace: Path) -> None:
         """test the classes that can be pickled behave as expected when the module is reloaded"""
@@ -543,28 +447,7 @@ class TestReload:
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module"'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(line for line in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _pickling_expected_parts())
 
     def test_submodule(self, workspace: Path) -> None:
         module_path = self._create_reload_module(workspace)
@@ -574,43 +457,34 @@ class TestReload:
 
         assert "SUCCESS" in output
 
-        e = re.escape
-
-        expected_parts = [
-            e("reload_helper [INFO] initial import start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module"'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] initial import finish"),
-            e("reload_helper [INFO] modifying module"),
-            e("reload_helper [INFO] reload start"),
-            e('maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
-            e('maturin_import_hook [INFO] building "my_module"'),
-            'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s',
-            e("root [INFO] my_module extension module initialised"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] reload start"),
-            e("reload_helper [INFO] reload failed"),
-            e("reload_helper [INFO] reload finish"),
-            e("reload_helper [INFO] SUCCESS"),
-            e("maturin_import_hook [DEBUG] removing temporary directory"),
-            "",  # end with anything
-        ]
-        expected_pattern = ".*".join(line for line in expected_parts)
-        check_match(output, expected_pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match_fast(output, _submodule_expected_parts())
 
 
 class TestLogging:
     """test the desired messages are visible to the user in the default logging configuration."""
 
-    def _create_clean_package(self, package_path: Path, *, reload_helper: bool = False) -> tuple[Path, Path]:
+    def _create_clean_package(
+        self,
+        package_path: Path,
+        *,
+        reload_helper: bool = False,
+        rs_transform: Optional[Callable[[str], str]] = None,
+    ) -> tuple[Path, Path]:
+        """create a package to test the logging of, optionally mutating the rust source.
+
+        applying `rs_transform` to the cached template and writing the result once avoids
+        the callers having to read back and rewrite the file that was just written
+        """
         package_path.mkdir()
-        rs_path = Path(shutil.copy(helpers_dir / "my_script_1.rs", package_path / "my_script.rs"))
+        rs_path = package_path / "my_script.rs"
+        if rs_transform is None:
+            _copy_helper("my_script_1.rs", rs_path)
+        else:
+            rs_path.write_text(rs_transform(_helper_bytes("my_script_1.rs").decode()))
         if reload_helper:
-            py_path = Path(shutil.copy(helpers_dir / "logging_reload_helper.py", package_path / "reload_helper.py"))
+            py_path = _copy_helper("logging_reload_helper.py", package_path / "reload_helper.py")
         else:
-            py_path = Path(shutil.copy(helpers_dir / "logging_helper.py", package_path / "helper.py"))
+            py_path = _copy_helper("logging_helper.py", package_path / "helper.py")
         return rs_path, py_path
 
     def test_maturin_detection(self, workspace: Path) -> None:
@@ -642,8 +516,7 @@ class TestLogging:
         _rs_path, py_path = self._create_clean_package(workspace / "package")
 
         output, _ = run_python([str(py_path)], workspace)
-        pattern = 'building "my_script"\nrebuilt and loaded module "my_script" in [0-9.]+s\nget_num 10\nSUCCESS\n'
-        check_match(output, pattern, flags=re.MULTILINE)
+        check_match(output, _DEFAULT_REBUILD_PATTERN)
 
     def test_default_up_to_date(self, workspace: Path) -> None:
         """By default, when the module is up-to-date nothing is printed."""
@@ -656,56 +529,29 @@ class TestLogging:
 
     def test_default_compile_error(self, workspace: Path) -> None:
         """If compilation fails then the error message from maturin is printed and an ImportError is raised."""
-        rs_path, py_path = self._create_clean_package(workspace / "package")
+        _rs_path, py_path = self._create_clean_package(
+            workspace / "package", rs_transform=lambda s: s.replace("10", "")
+        )
 
-        rs_path.write_text(rs_path.read_text().replace("10", ""))
         output, _ = run_python([str(py_path)], workspace, quiet=True)
-        pattern = (
-            'building "my_script"\n'
-            'maturin_import_hook \\[ERROR\\] command ".*" returned non-zero exit status: 1\n'
-            "maturin_import_hook \\[ERROR\\] maturin output:\n"
-            ".*"
-            "expected `usize`, found `\\(\\)`"
-            ".*"
-            "maturin failed"
-            ".*"
-            "caught MaturinError\\('Failed to build wheel with maturin'\\)\n"
-        )
-        check_match(output, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output, _DEFAULT_COMPILE_ERROR_PATTERN)
 
     def test_default_compile_warning(self, workspace: Path) -> None:
         """If compilation succeeds with warnings then the output of maturin is printed.
         If the module is already up to date but warnings were raised when it was first
         built, the warnings will be printed again.
         """
-        rs_path, py_path = self._create_clean_package(workspace / "package")
-        rs_path.write_text(rs_path.read_text().replace("10", "#[warn(unused_variables)]{let x = 12;}; 20"))
+        _rs_path, py_path = self._create_clean_package(
+            workspace / "package", rs_transform=lambda s: s.replace("10", "#[warn(unused_variables)]{let x = 12;}; 20")
+        )
 
         output1, _ = run_python([str(py_path)], workspace)
         output1 = remove_ansii_escape_characters(output1)
-        pattern = (
-            'building "my_script"\n'
-            'maturin_import_hook \\[WARNING\\] build of "my_script" succeeded with warnings:\n'
-            ".*"
-            "warning: unused variable: `x`"
-            ".*"
-            'rebuilt and loaded module "my_script" in [0-9.]+s\n'
-            "get_num 20\n"
-            "SUCCESS\n"
-        )
-        check_match(output1, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output1, _DEFAULT_COMPILE_WARNING_REBUILD_PATTERN)
 
         output2, _ = run_python([str(py_path)], workspace)
         output2 = remove_ansii_escape_characters(output2)
-        pattern = (
-            'maturin_import_hook \\[WARNING\\] the last build of "my_script" succeeded with warnings:\n'
-            ".*"
-            "warning: unused variable: `x`"
-            ".*"
-            "get_num 20\n"
-            "SUCCESS\n"
-        )
-        check_match(output2, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output2, _DEFAULT_COMPILE_WARNING_UP_TO_DATE_PATTERN)
 
     @pytest.mark.skipif(not RELOAD_SUPPORTED, reason="reload not supported")
     def test_reload(self, workspace: Path) -> None:
@@ -713,21 +559,7 @@ class TestLogging:
 
         output1, _ = run_python([str(py_path)], workspace)
         output1 = remove_ansii_escape_characters(output1)
-        pattern = (
-            "initial import start\n"
-            'building "my_script"\n'
-            'rebuilt and loaded module "my_script" in [0-9.]+s\n'
-            "initial import finish\n"
-            "reload start\n"
-            'building "my_script"\n'
-            'rebuilt and loaded module "my_script" in [0-9.]+s\n'
-            "reload finish\n"
-            "reload start\n"
-            "reload finish\n"
-            "get_num 10\n"
-            "SUCCESS\n"
-        )
-        check_match(output1, pattern, flags=re.MULTILINE | re.DOTALL)
+        check_match(output1, _LOGGING_RELOAD_PATTERN)
 
     def test_reset_logger_without_configuring(self, workspace: Path) -> None:
         """If reset_logger is called then by default logging level INFO is not printed
@@ -739,12 +571,266 @@ class TestLogging:
 
     def test_successful_compilation_but_not_valid(self, workspace: Path) -> None:
         """If the script compiles but does not import correctly an ImportError is raised."""
-        rs_path, py_path = self._create_clean_package(workspace / "package")
-        rs_path.write_text(rs_path.read_text().replace("my_script", "my_script_new_name"))
-        output, _ = run_python([str(py_path)], workspace, quiet=True)
-        pattern = (
-            'building "my_script"\n'
-            'rebuilt and loaded module "my_script" in [0-9.]+s\n'
-            f"caught ImportError\\('{missing_entrypoint_error_message_pattern('my_script')}'\\)\n"
+        _rs_path, py_path = self._create_clean_package(
+            workspace / "package", rs_transform=lambda s: s.replace("my_script", "my_script_new_name")
         )
-        check_match(output, pattern, flags=re.MULTILINE)
+        output, _ = run_python([str(py_path)], workspace, quiet=True)
+        check_match(output, _successful_compilation_but_not_valid_pattern())
+
+
+_REBUILT_MY_MODULE_PATTERN = 'maturin_import_hook \\[INFO\\] rebuilt and loaded module "my_module" in [0-9.]+s'
+"""the one non-literal line in the expected reload log output (the build time varies)"""
+
+
+@lru_cache
+def _basic_reload_expected_info_pattern() -> "re.Pattern[str]":
+    """the expected log output is constant, so each of these patterns is escaped, joined
+    and compiled on the first run of the test that uses it rather than on every run
+    """
+    e = re.escape
+    expected_info_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e('maturin_import_hook [INFO] building "my_module"'),  # because: no build status
+        _REBUILT_MY_MODULE_PATTERN,
+        e("root [INFO] my_module extension module initialised"),
+        e("reload_helper [INFO] initial import finish"),
+        e("root [INFO] comparing Integer instances a and b"),
+        e("root [INFO] comparing Integer instances a and c"),
+        e("reload_helper [INFO] modifying module"),
+        e("reload_helper [INFO] reload 1 start"),
+        e('maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_MY_MODULE_PATTERN,
+        e("root [INFO] my_module extension module initialised"),
+        e("reload_helper [INFO] reload 1 finish"),
+        e("root [INFO] comparing Integer instances d and e"),
+        e("reload_helper [INFO] reload 2 start"),
+        e(
+            "root [INFO] my_module extension module initialised"
+        ),  # note: this is different from the package importer
+        e("reload_helper [INFO] reload 2 finish"),
+        e("reload_helper [INFO] modifying module"),
+        e("reload_helper [INFO] reload 3 start"),
+        e('maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_MY_MODULE_PATTERN,
+        e("root [INFO] my_module extension module initialised"),
+        e("reload_helper [INFO] reload 3 finish"),
+        e("reload_helper [INFO] SUCCESS"),
+    ]
+    return re.compile("\n".join(expected_info_parts), re.MULTILINE)
+
+
+@lru_cache
+def _globals_expected_info_pattern() -> "re.Pattern[str]":
+    e = re.escape
+    expected_info_parts = [
+        e("reload_helper [INFO] initial import start"),
+        e('maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_MY_MODULE_PATTERN,
+        e("root [INFO] my_module extension module initialised"),
+        e("reload_helper [INFO] initial import finish"),
+        e("reload_helper [INFO] checking extension module"),
+        e("reload_helper [INFO] reload 1 start"),
+        e("root [INFO] my_module extension module initialised"),
+        e("reload_helper [INFO] reload 2 finish"),
+        e("reload_helper [INFO] checking extension module"),
+        e("reload_helper [INFO] modifying module"),
+        e("reload_helper [INFO] reload 2 start"),
+        e('maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_MY_MODULE_PATTERN,
+        e("root [INFO] my_module extension module initialised"),
+        e("reload_helper [INFO] reload 2 finish"),
+        e("reload_helper [INFO] checking extension module"),
+        e("reload_helper [INFO] SUCCESS"),
+    ]
+    return re.compile("\n".join(expected_info_parts), re.MULTILINE)
+
+
+_REBUILT_RE_PART = ("re", _REBUILT_MY_MODULE_PATTERN)
+
+
+@lru_cache
+def _other_module_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] module "my_module" will be rebuilt because: already built module not found'),
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "root [INFO] other module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying module"),
+        ("lit", "reload_helper [INFO] reload 1 start"),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        ("lit", 'maturin_import_hook [DEBUG] handling reload of "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] reload 1 finish"),
+        ("lit", "reload_helper [INFO] reload 2 start"),
+        ("lit", "root [INFO] other module initialised"),
+        ("lit", "reload_helper [INFO] reload 2 finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+@lru_cache
+def _reload_without_import_hook_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", "reload_helper [INFO] module not found"),
+        ("lit", "reload_helper [INFO] installing import hook"),
+        ("lit", 'module "my_module" will be rebuilt because: already built module not found'),
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] reload module start"),
+        ("lit", 'maturin_import_hook [DEBUG] module "my_module" is already loaded and enable_reloading=False'),
+        ("lit", "reload_helper [INFO] reload module finish"),
+        ("lit", "reload_helper [INFO] modifying module"),
+        ("lit", "reload_helper [INFO] reload module start"),
+        ("lit", 'maturin_import_hook [DEBUG] module "my_module" is already loaded and enable_reloading=False'),
+        ("lit", "reload_helper [INFO] reload module finish"),
+        ("lit", "reload_helper [INFO] uninstalling import hook"),
+        ("lit", "reload_helper [INFO] reload module start"),
+        ("lit", "reload_helper [INFO] module not found"),
+        ("lit", "reload_helper [INFO] reload module finish"),
+        ("lit", "reload_helper [INFO] SUCCESS\n"),
+    )
+
+
+@lru_cache
+def _compilation_error_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module"'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying module"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        ("lit", "expected expression, found `;`"),
+        ("lit", "maturin failed"),
+        ("lit", "reload_helper [INFO] reload failed"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] modifying module"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+@lru_cache
+def _pickling_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module"'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying module"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+@lru_cache
+def _submodule_expected_parts() -> tuple[tuple[str, str], ...]:
+    return (
+        ("lit", "reload_helper [INFO] initial import start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module"'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] initial import finish"),
+        ("lit", "reload_helper [INFO] modifying module"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", 'maturin_import_hook [DEBUG] MaturinRustFileImporter searching for "my_module" (reload)'),
+        ("lit", 'maturin_import_hook [INFO] building "my_module"'),
+        _REBUILT_RE_PART,
+        ("lit", "root [INFO] my_module extension module initialised"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] reload start"),
+        ("lit", "reload_helper [INFO] reload failed"),
+        ("lit", "reload_helper [INFO] reload finish"),
+        ("lit", "reload_helper [INFO] SUCCESS"),
+        ("lit", "maturin_import_hook [DEBUG] removing temporary directory"),
+    )
+
+
+_DEFAULT_REBUILD_PATTERN = re.compile(
+    'building "my_script"\nrebuilt and loaded module "my_script" in [0-9.]+s\nget_num 10\nSUCCESS\n', re.MULTILINE
+)
+
+_DEFAULT_COMPILE_ERROR_PATTERN = re.compile(
+    'building "my_script"\n'
+    'maturin_import_hook \\[ERROR\\] command ".*?" returned non-zero exit status: 1\n'
+    "maturin_import_hook \\[ERROR\\] maturin output:\n"
+    ".*?"
+    "expected `usize`, found `\\(\\)`"
+    ".*?"
+    "maturin failed"
+    ".*?"
+    "caught MaturinError\\('Failed to build wheel with maturin'\\)\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+_DEFAULT_COMPILE_WARNING_REBUILD_PATTERN = re.compile(
+    'building "my_script"\n'
+    'maturin_import_hook \\[WARNING\\] build of "my_script" succeeded with warnings:\n'
+    ".*?"
+    "warning: unused variable: `x`"
+    ".*?"
+    'rebuilt and loaded module "my_script" in [0-9.]+s\n'
+    "get_num 20\n"
+    "SUCCESS\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+_DEFAULT_COMPILE_WARNING_UP_TO_DATE_PATTERN = re.compile(
+    'maturin_import_hook \\[WARNING\\] the last build of "my_script" succeeded with warnings:\n'
+    ".*?"
+    "warning: unused variable: `x`"
+    ".*?"
+    "get_num 20\n"
+    "SUCCESS\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+_LOGGING_RELOAD_PATTERN = re.compile(
+    "initial import start\n"
+    'building "my_script"\n'
+    'rebuilt and loaded module "my_script" in [0-9.]+s\n'
+    "initial import finish\n"
+    "reload start\n"
+    'building "my_script"\n'
+    'rebuilt and loaded module "my_script" in [0-9.]+s\n'
+    "reload finish\n"
+    "reload start\n"
+    "reload finish\n"
+    "get_num 10\n"
+    "SUCCESS\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+@lru_cache
+def _successful_compilation_but_not_valid_pattern() -> "re.Pattern[str]":
+    """compiled lazily because the expected missing entrypoint message depends on the platform"""
+    return re.compile(
+        'building "my_script"\n'
+        'rebuilt and loaded module "my_script" in [0-9.]+s\n'
+        f"caught ImportError\\('{missing_entrypoint_error_message_pattern('my_script')}'\\)\n",
+        re.MULTILINE,
+    )
@@ -11,16 +11,80 @@ from maturin_import_hook._site import (
 
 from .common import capture_logs
 
+_EXISTING_CODE = dedent("""\
+# some existing code
+print(123)
+install()  # another import hook
+""")
+
+# the expected file contents are dedented once at module load instead of inside each test
+_HOOK_INSTALLATION = dedent("""\
+# <maturin_import_hook>
+# the following installs the maturin import hook during startup.
+# see: `python -m maturin_import_hook site`
+try:
+    import maturin_import_hook
+    from maturin_import_hook.settings import MaturinSettings
+    maturin_import_hook.install(
+        settings=MaturinSettings(
+            color=True
+        ),
+        enable_project_importer=True,
+        enable_rs_file_importer=True,
+    )
+except Exception as e:
+    raise RuntimeError(
+        f"{e}\\n>> ERROR in managed maturin_import_hook installation. "
+        "Remove with `<uninstall>`\\n",
+    )
+# </maturin_import_hook>
+""")
+
+_EXPECTED_CODE_AFTER_INSTALL = _EXISTING_CODE + "\n" + _HOOK_INSTALLATION
+
+_EXPECTED_CODE_AFTER_REMOVE = dedent("""\
+# some existing code
+print(123)
+install()  # another import hook
+
+# some more text
+install()
+""")
+
+_EXPECTED_CODE_AFTER_FORCE_OVERWRITE = dedent("""\
+# some existing code
+print(123)
+install()  # another import hook
+
+
+
+# more code
+# <maturin_import_hook>
+# the following installs the maturin import hook during startup.
+# see: `python -m maturin_import_hook site`
+try:
+    import maturin_import_hook
+    from maturin_import_hook.settings import MaturinSettings
+    maturin_import_hook.install(
+        settings=MaturinSettings(
+            release=True,
+            color=True
+        ),
+        enable_project_importer=True,
+        enable_rs_file_importer=True,
+    )
+except Exception as e:
+    raise RuntimeError(
+        f"{e}\\n>> ERROR in managed maturin_import_hook installation. "
+        "Remove with `<uninstall>`\\n",
+    )
+# </maturin_import_hook>
+""")
+
 
 def test_automatic_site_installation(tmp_path: Path) -> None:
     sitecustomize = tmp_path / "sitecustomize.py"
-    header = dedent("""\
-    # some existing code
-    print(123)
-    install()  # another import hook
-    """)
-
-    sitecustomize.write_text(header)
+    sitecustomize.write_text(_EXISTING_CODE)
 
     assert not has_automatic_installation(sitecustomize)
 
@@ -47,33 +111,7 @@ def test_automatic_site_installation(tmp_path: Path) -> None:
         logs = cap.getvalue()
     assert "already installed. Aborting install" in logs
 
-    expected_code = dedent("""\
-    # some existing code
-    print(123)
-    install()  # another import hook
-
-    # <maturin_import_hook>
-    # the following installs the maturin import hook during startup.
-    # see: `python -m maturin_import_hook site`
-    try:
-        import maturin_import_hook
-        from maturin_import_hook.settings import MaturinSettings
-        maturin_import_hook.install(
-            settings=MaturinSettings(
-                color=True
-            ),
-            enable_project_importer=True,
-            enable_rs_file_importer=True,
-        )
-    except Exception as e:
-        raise RuntimeError(
-            f"{e}\\n>> ERROR in managed maturin_import_hook installation. "
-            "Remove with `<uninstall>`\\n",
-        )
-    # </maturin_import_hook>
-    """)
-
-    assert sitecustomize.read_text() == expected_code
+    assert sitecustomize.read_text() == _EXPECTED_CODE_AFTER_INSTALL
     assert has_automatic_installation(sitecustomize)
 
     sitecustomize.write_text(sitecustomize.read_text() + "# some more text\ninstall()\n")
@@ -82,15 +120,7 @@ def test_automatic_site_installation(tmp_path: Path) -> None:
 
     remove_automatic_installation(sitecustomize)
 
-    expected_code = dedent("""\
-    # some existing code
-    print(123)
-    install()  # another import hook
-
-    # some more text
-    install()
-    """)
-    assert sitecustomize.read_text() == expected_code
+    assert sitecustomize.read_text() == _EXPECTED_CODE_AFTER_REMOVE
     assert not has_automatic_installation(sitecustomize)
 
     with capture_logs() as cap:
@@ -101,13 +131,7 @@ def test_automatic_site_installation(tmp_path: Path) -> None:
 
 def test_automatic_site_installation_force_overwrite(tmp_path: Path) -> None:
     sitecustomize = tmp_path / "sitecustomize.py"
-    header = dedent("""\
-    # some existing code
-    print(123)
-    install()  # another import hook
-    """)
-
-    sitecustomize.write_text(header)
+    sitecustomize.write_text(_EXISTING_CODE)
 
     insert_automatic_installation(
         sitecustomize,
@@ -134,37 +158,7 @@ def test_automatic_site_installation_force_overwrite(tmp_path: Path) -> None:
         logs = cap.getvalue()
     assert "already installed, but force=True. Overwriting..." in logs
 
-    expected_code = dedent("""\
-    # some existing code
-    print(123)
-    install()  # another import hook
-
-
-
-    # more code
-    # <maturin_import_hook>
-    # the following installs the maturin import hook during startup.
-    # see: `python -m maturin_import_hook site`
-    try:
-        import maturin_import_hook
-        from maturin_import_hook.settings import MaturinSettings
-        maturin_import_hook.install(
-            settings=MaturinSettings(
-                release=True,
-                color=True
-            ),
-            enable_project_importer=True,
-            enable_rs_file_importer=True,
-        )
-    except Exception as e:
-        raise RuntimeError(
-            f"{e}\\n>> ERROR in managed maturin_import_hook installation. "
-            "Remove with `<uninstall>`\\n",
-        )
-    # </maturin_import_hook>
-    """)
-
-    assert sitecustomize.read_text() == expected_code
+    assert sitecustomize.read_text() == _EXPECTED_CODE_AFTER_FORCE_OVERWRITE
     assert has_automatic_installation(sitecustomize)
 
 
@@ -195,29 +189,7 @@ def test_automatic_site_installation_empty(tmp_path: Path) -> None:
         detect_uv=False,
     )
 
-    expected_code = dedent("""\
-    # <maturin_import_hook>
-    # the following installs the maturin import hook during startup.
-    # see: `python -m maturin_import_hook site`
-    try:
-        import maturin_import_hook
-        from maturin_import_hook.settings import MaturinSettings
-        maturin_import_hook.install(
-            settings=MaturinSettings(
-                color=True
-            ),
-            enable_project_importer=True,
-            enable_rs_file_importer=True,
-        )
-    except Exception as e:
-        raise RuntimeError(
-            f"{e}\\n>> ERROR in managed maturin_import_hook installation. "
-            "Remove with `<uninstall>`\\n",
-        )
-    # </maturin_import_hook>
-    """)
-
-    assert sitecustomize.read_text() == expected_code
+    assert sitecustomize.read_text() == _HOOK_INSTALLATION
     assert has_automatic_installation(sitecustomize)
 
     remove_automatic_installation(sitecustomize)
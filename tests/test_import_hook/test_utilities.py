@@ -4,8 +4,8 @@ import os
 import platform
 import re
 import subprocess
-import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -158,113 +158,119 @@ class TestGetInstallationFreshness:
         return BuildStatus(build_mtime=path.stat().st_mtime, source_path=Path("/"), maturin_args=[], maturin_output="")
 
     def test_missing_installation(self, tmp_path: Path) -> None:
-        (tmp_path / "source").touch()
-        (tmp_path / "install").touch()
-        s = self._build_status_for_file(tmp_path / "install")
-
-        freshness = get_installation_freshness([tmp_path / "source"], [], s)
+        source = tmp_path / "source"
+        install = tmp_path / "install"
+        missing = tmp_path / "missing"
+        source.touch()
+        install.touch()
+        s = self._build_status_for_file(install)
+
+        freshness = get_installation_freshness([source], [], s)
         assert freshness == Freshness(False, "no installed files found", None, None)
 
         with capture_logs() as cap:
-            freshness = get_installation_freshness([tmp_path / "source"], [tmp_path / "missing"], s)
+            freshness = get_installation_freshness([source], [missing], s)
         assert freshness == Freshness(False, "failed to read installed files", None, None)
         expected_logs = (
-            "error reading installed file mtimes: "
-            f"FileNotFoundError(2, '{_file_not_found_message()}') ({tmp_path / 'missing'})\n"
+            f"error reading installed file mtimes: FileNotFoundError(2, '{_FILE_NOT_FOUND_MESSAGE}') ({missing})\n"
         )
         assert cap.getvalue() == expected_logs
 
         with capture_logs() as cap:
-            freshness = get_installation_freshness(
-                [tmp_path / "source"], [tmp_path / "install", tmp_path / "missing"], s
-            )
+            freshness = get_installation_freshness([source], [install, missing], s)
         assert freshness == Freshness(False, "failed to read installed files", None, None)
         assert cap.getvalue() == expected_logs
 
     def test_missing_source(self, tmp_path: Path) -> None:
-        (tmp_path / "source").touch()
-        (tmp_path / "install").touch()
-        s = self._build_status_for_file(tmp_path / "install")
+        source = tmp_path / "source"
+        install = tmp_path / "install"
+        missing = tmp_path / "missing"
+        source.touch()
+        install.touch()
+        s = self._build_status_for_file(install)
 
         with pytest.raises(ImportHookError, match="no source files found"):
-            get_installation_freshness([], [tmp_path / "install"], s)
+            get_installation_freshness([], [install], s)
 
         expected_error = re.escape(
-            "error reading source file mtimes: "
-            f"FileNotFoundError(2, '{_file_not_found_message()}') ({tmp_path / 'missing'})"
+            f"error reading source file mtimes: FileNotFoundError(2, '{_FILE_NOT_FOUND_MESSAGE}') ({missing})"
         )
         with pytest.raises(ImportHookError, match=expected_error):
-            get_installation_freshness([tmp_path / "missing"], [tmp_path / "install"], s)
+            get_installation_freshness([missing], [install], s)
 
         with pytest.raises(ImportHookError, match=expected_error):
-            get_installation_freshness([tmp_path / "source", tmp_path / "missing"], [tmp_path / "install"], s)
+            get_installation_freshness([source, missing], [install], s)
 
     def test_mismatched_build_status(self, tmp_path: Path) -> None:
-        (tmp_path / "source").touch()
-        (tmp_path / "install").touch()
+        source = tmp_path / "source"
+        install = tmp_path / "install"
+        source.touch()
+        install.touch()
         s = self._build_status(0)
 
-        freshness = get_installation_freshness([tmp_path / "source"], [tmp_path / "install"], s)
+        freshness = get_installation_freshness([source], [install], s)
         assert freshness == Freshness(
-            False, "installation mtime does not match build status mtime", tmp_path / "install", None
+            False, "installation mtime does not match build status mtime", install, None
         )
 
-        (tmp_path / "install_1").touch()
-        (tmp_path / "install_2").touch()
-        _set_strictly_ordered_mtimes([tmp_path / "install_1", tmp_path / "install_2", tmp_path / "source"])
+        install_1 = tmp_path / "install_1"
+        install_2 = tmp_path / "install_2"
+        install_1.touch()
+        install_2.touch()
+        _set_strictly_ordered_mtimes([install_1, install_2, source])
 
-        s = self._build_status_for_file(tmp_path / "install_2")
+        s = self._build_status_for_file(install_2)
 
-        freshness = get_installation_freshness(
-            [tmp_path / "source"], [tmp_path / "install_1", tmp_path / "install_2"], s
-        )
+        freshness = get_installation_freshness([source], [install_1, install_2], s)
         assert freshness == Freshness(
-            False, "installation mtime does not match build status mtime", tmp_path / "install_1", None
+            False, "installation mtime does not match build status mtime", install_1, None
         )
 
     def test_read_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         unreadable_dir = tmp_path / "unreadable"
+        unreadable_source = unreadable_dir / "source"
+        unreadable_install = unreadable_dir / "install"
         unreadable_dir.mkdir()
-        (unreadable_dir / "source").touch()
+        unreadable_source.touch()
 
-        (unreadable_dir / "install").touch()
-        unreadable_status = self._build_status_for_file(unreadable_dir / "install")
+        unreadable_install.touch()
+        unreadable_status = self._build_status_for_file(unreadable_install)
 
         readable_dir = tmp_path / "readable"
+        readable_install = readable_dir / "install"
         readable_dir.mkdir()
 
-        (readable_dir / "install").touch()
-        readable_status = self._build_status_for_file(readable_dir / "install")
+        readable_install.touch()
+        readable_status = self._build_status_for_file(readable_install)
 
         _mock_directory_as_unreadable(unreadable_dir, monkeypatch)
 
         with capture_logs() as cap:
-            freshness = get_installation_freshness([], [unreadable_dir / "install"], unreadable_status)
+            freshness = get_installation_freshness([], [unreadable_install], unreadable_status)
         expected_logs = (
-            "error reading installed file mtimes: "
-            f"PermissionError(13, 'Permission denied') ({unreadable_dir / 'install'})\n"
+            f"error reading installed file mtimes: PermissionError(13, 'Permission denied') ({unreadable_install})\n"
         )
         assert cap.getvalue() == expected_logs
         assert freshness == Freshness(False, "failed to read installed files", None, None)
 
         expected_error = re.escape(
-            f"error reading source file mtimes: PermissionError(13, 'Permission denied') ({unreadable_dir / 'source'})"
+            f"error reading source file mtimes: PermissionError(13, 'Permission denied') ({unreadable_source})"
         )
         with pytest.raises(ImportHookError, match=expected_error):
-            get_installation_freshness([unreadable_dir / "source"], [readable_dir / "install"], readable_status)
+            get_installation_freshness([unreadable_source], [readable_install], readable_status)
 
     def test_equal_mtime(self, tmp_path: Path) -> None:
-        (tmp_path / "source").touch()
-        (tmp_path / "install").touch()
-        set_file_times(tmp_path / "source", get_file_times(tmp_path / "install"))
-        s = self._build_status_for_file(tmp_path / "install")
+        source = tmp_path / "source"
+        install = tmp_path / "install"
+        source.touch()
+        install.touch()
+        set_file_times(source, get_file_times(install))
+        s = self._build_status_for_file(install)
 
-        assert (tmp_path / "source").stat().st_mtime == (tmp_path / "install").stat().st_mtime
+        assert source.stat().st_mtime == install.stat().st_mtime
 
-        freshness = get_installation_freshness([tmp_path / "source"], [tmp_path / "install"], s)
-        assert freshness == Freshness(
-            False, "installation may be out of date", tmp_path / "install", tmp_path / "source"
-        )
+        freshness = get_installation_freshness([source], [install], s)
+        assert freshness == Freshness(False, "installation may be out of date", install, source)
 
     def test_simple_cases(self, tmp_path: Path) -> None:
         source_1 = tmp_path / "source_1"
@@ -308,7 +314,7 @@ def test_set_strictly_ordered_mtimes(tmp_path: Path) -> None:
 def _set_strictly_ordered_mtimes(paths: list[Path]) -> None:
     atime, mtime = get_file_times(paths[0])
     for i, p in enumerate(reversed(paths)):
-        set_file_times(p, (atime, mtime - i))
+        set_file_times(p, (atime, mtime - i * 1_000_000_000))
 
 
 @pytest.mark.parametrize("project_name", sorted(resolved_packages().keys()))
@@ -432,43 +438,42 @@ def test_get_string_between() -> None:
 
 
 def test_set_file_times(tmp_path: Path) -> None:
-    for _ in range(10):
-        file_a = tmp_path / "a"
-        file_a.touch()
-        time.sleep(0.1)
-        file_b = tmp_path / "b"
-        file_b.touch()
-        assert file_a.stat().st_mtime != file_b.stat().st_mtime
-        times = get_file_times(file_a)
-        set_file_times(file_b, times)
-        assert file_a.stat().st_mtime == file_b.stat().st_mtime
+    file_a = tmp_path / "a"
+    file_a.touch()
+    file_b = tmp_path / "b"
+    file_b.touch()
+    # offset one file by a second explicitly instead of sleeping between the writes
+    atime, mtime = get_file_times(file_a)
+    os.utime(file_b, ns=(atime + 1_000_000_000, mtime + 1_000_000_000))
+    assert file_a.stat().st_mtime != file_b.stat().st_mtime
+    set_file_times(file_b, get_file_times(file_a))
+    assert file_a.stat().st_mtime == file_b.stat().st_mtime
 
 
 def _mock_directory_as_unreadable(dir_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """cause PermissionError to be raised when calling `pathlib.Path.stat()` on a file inside the given directory
+    """cause PermissionError to be raised when calling `os.stat()` on a file inside the given directory
 
     on POSIX, could use `os.chmod(0o000)` but on Windows there is no easy mechanism for causing a PermissionError
     to be raised when accessing a file, so monkey patch instead
     """
 
-    original_stat = Path.stat
+    original_stat = os.stat
 
-    def patched_stat(self: Path) -> object:
-        if Path.is_relative_to(self, dir_path):
+    def patched_stat(path: Any, *args: Any, **kwargs: Any) -> object:
+        if isinstance(path, (str, Path)) and Path(path).is_relative_to(dir_path):
             e = PermissionError(13, "Permission denied")
-            e.filename = str(self)
+            e.filename = str(path)
             raise e
-        return original_stat(self)
+        return original_stat(path, *args, **kwargs)
 
-    monkeypatch.setattr(Path, "stat", patched_stat)
+    monkeypatch.setattr(os, "stat", patched_stat)
 
     with pytest.raises(PermissionError, match="Permission denied") as e_info:
-        (dir_path / "abc").stat()
+        os.stat(dir_path / "abc")
     assert e_info.value.errno == 13
     assert e_info.value.filename == str(dir_path / "abc")
 
 
-def _file_not_found_message() -> str:
-    return (
-        "The system cannot find the file specified" if platform.system() == "Windows" else "No such file or directory"
-    )
+_FILE_NOT_FOUND_MESSAGE = (
+    "The system cannot find the file specified" if platform.system() == "Windows" else "No such file or directory"
+)